@@ -1,3 +1,16 @@
+from argparser import app_parser
+
+args = app_parser.parse_args()
+
+# profiler has to be set up before importing GUI, to measure imports too
+# (it starts with "import" phase)
+if args.profile_startup:
+    from startup_profiler import StartupProfiler
+    profiler = StartupProfiler(args.profile_startup)
+else:
+    profiler = None
+
 from mac_easy_manager import MACEasyManager
 
-app = MACEasyManager()
+app = MACEasyManager(profiler)
+app.run()
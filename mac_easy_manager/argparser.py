@@ -0,0 +1,128 @@
+from argparse import ArgumentParser
+
+SORT_KEYS = ["name", "color", "icon"]
+
+batch_parser = ArgumentParser(description="Sorts and edits containers of many Firefox profiles at once.")
+
+batch_parser.add_argument(
+    "profiles",
+    nargs="*",
+    help="Names of profiles (from profiles.ini) or paths to profile folders."
+    )
+
+batch_parser.add_argument(
+    "-g","--glob",
+    action="append",
+    default=[],
+    help="Selects profiles whose name or folder path matches the glob pattern. Can be given multiple times."
+    )
+
+batch_parser.add_argument(
+    "-f","--folder",
+    help="Path to Firefox data folder with profiles.ini (defaults to the one in AppData)."
+    )
+
+batch_parser.add_argument(
+    "-s","--sort",
+    nargs="+",
+    choices=SORT_KEYS,
+    metavar="KEY",
+    help="Primary and optionally secondary sorting key (name, color, icon)."
+    )
+
+batch_parser.add_argument(
+    "-r","--reverse",
+    nargs="+",
+    choices=SORT_KEYS,
+    default=[],
+    metavar="KEY",
+    help="Sorting keys to sort in reverse."
+    )
+
+batch_parser.add_argument(
+    "-o","--sort-options",
+    help="Path to sorting_options.json file to take sorting presets from (overrides --sort and --reverse). Each profile is sorted with the preset bound to it, or with the default preset."
+    )
+
+batch_parser.add_argument(
+    "-p","--preset",
+    help="Name of sorting preset to sort all profiles with (from sorting_options.json, or file given with --sort-options)."
+    )
+
+batch_parser.add_argument(
+    "--rename",
+    nargs=2,
+    action="append",
+    default=[],
+    metavar=("PATTERN","NAME"),
+    help="Renames containers whose name matches the regular expression (NAME may use backreferences)."
+    )
+
+batch_parser.add_argument(
+    "--recolor",
+    nargs=2,
+    action="append",
+    default=[],
+    metavar=("PATTERN","COLOR"),
+    help="Changes color of containers whose name matches the regular expression."
+    )
+
+batch_parser.add_argument(
+    "--reicon",
+    nargs=2,
+    action="append",
+    default=[],
+    metavar=("PATTERN","ICON"),
+    help="Changes icon of containers whose name matches the regular expression."
+    )
+
+batch_parser.add_argument(
+    "-i","--ignore",
+    action="append",
+    default=[],
+    help="Ignores containers whose name starts with the given text (or one of comma-separated texts) followed by any number of digits. Can be given multiple times."
+    )
+
+batch_parser.add_argument(
+    "--ignore-file",
+    help="Path to a text file with one text (or regular expression with --regex) to ignore per line."
+    )
+
+batch_parser.add_argument(
+    "--regex",
+    action="store_true",
+    help="Treats --ignore and --ignore-file as regular expressions."
+    )
+
+batch_parser.add_argument(
+    "--ignore-case",
+    action="store_true",
+    help="Makes --ignore and --ignore-file case-insensitive."
+    )
+
+batch_parser.add_argument(
+    "-l","--language",
+    help="Language of default containers' names (detected from each profile by default)."
+    )
+
+batch_parser.add_argument(
+    "-w","--workers",
+    type=int,
+    help="Determines the number of worker processes (defaults to number of CPUs)."
+    )
+
+batch_parser.add_argument(
+    "-n","--dry-run",
+    action="store_true",
+    help="Applies changes without saving them."
+    )
+
+app_parser = ArgumentParser(description="Manages Firefox Multi-Account Containers.")
+
+app_parser.add_argument(
+    "--profile-startup",
+    nargs="?",
+    const="startup_profile.json",
+    metavar="PATH",
+    help="Measures time of each startup phase and number of created widgets and writes a report to PATH (defaults to startup_profile.json)."
+    )
@@ -0,0 +1,249 @@
+from argparser import batch_parser, SORT_KEYS
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from container_engine import ContainerEngine, FIREFOX_FOLDER_PATH, get_profiles, get_def_language
+from fnmatch import fnmatch
+import glob
+from ignore_matcher import split_patterns
+import json
+import logging
+from pathlib import Path
+import re
+from sort_presets import DEFAULT_PRESET, SortPresets, preset_to_spec
+import sys
+import time
+import traceback
+from translation_store import TranslationStore
+
+# characters not allowed in backup file names
+BACKUP_UNSAFE_CHARS = re.compile(r'[\\/:*?"<>|]')
+
+#region PROFILE SELECTION
+def select_profiles(names,globs,folder_path):
+    # profiles listed in profiles.ini
+    # {name: {"path": Path, "is_default": bool}}
+    prof_dict = get_profiles(folder_path)
+
+    # {name: path}
+    selected = {}
+    # resolved paths of selected profiles, so that each one is processed once
+    # (e.g. when given both by name and by path)
+    selected_paths = set()
+
+    def add(name,path):
+        resolved = Path(path).resolve()
+        if resolved in selected_paths:
+            return
+
+        # different folders with the same name (e.g. a/default and b/default)
+        # are told apart by their full path
+        if name in selected:
+            name = str(path)
+
+        selected_paths.add(resolved)
+        selected[name] = path
+
+    for name in names:
+        if name in prof_dict:
+            add(name,prof_dict[name]["path"])
+        # name can also be a path to a profile folder
+        elif (Path(name) / "containers.json").exists():
+            add(Path(name).name,Path(name))
+        else:
+            raise ValueError(f"Profile not found: {name}")
+
+    for pattern in globs:
+        # matches profile names and paths from profiles.ini
+        for name, profile in prof_dict.items():
+            if fnmatch(name,pattern) or fnmatch(str(profile["path"]),pattern):
+                add(name,profile["path"])
+
+        # matches profile folders on disk
+        for path in glob.glob(pattern):
+            if (Path(path) / "containers.json").exists():
+                add(Path(path).name,Path(path))
+
+    return selected
+#endregion
+
+#region SORT SPEC
+def get_sort_specs(args,profiles):
+    # returns {name: (primary, secondary, reverse_lst) or None} for each profile
+    # presets: given one, else one bound to profile (like in GUI), else default one
+    if args.sort_options or args.preset:
+        presets = SortPresets(args.sort_options or "sorting_options.json")
+
+        if args.preset is not None and args.preset not in presets:
+            raise ValueError(f"Unknown sorting preset: {args.preset}")
+
+        specs = {}
+        for name, path in profiles.items():
+            preset_name = args.preset or presets.get_binding(path) or DEFAULT_PRESET
+            specs[name] = preset_to_spec(presets[preset_name]) if preset_name in presets else None
+
+        return specs
+
+    return dict.fromkeys(profiles,get_sort_spec(args))
+
+def get_sort_spec(args):
+    # returns (primary, secondary, reverse_lst) from --sort and --reverse, like sorting options in GUI
+    # or None if containers shouldn't be sorted
+    if not args.sort:
+        return None
+
+    if len(args.sort) > 2 or len(set(args.sort)) != len(args.sort):
+        raise ValueError("--sort takes 1 or 2 different keys.")
+
+    prim = SORT_KEYS.index(args.sort[0])
+    # if no secondary key given, selects next one (same as GUI)
+    sec = SORT_KEYS.index(args.sort[1]) if len(args.sort) == 2 else (prim+1)%3
+    # tertiary = remaining key
+    tert = tuple({0, 1, 2}.difference({prim, sec}))[0]
+
+    reverse_lst = [int(SORT_KEYS[option] in args.reverse) for option in (prim, sec, tert)]
+
+    return prim, sec, reverse_lst
+#endregion
+
+#region WORKER
+def init_worker(translations):
+    # translations are passed once per worker process, not once per profile
+    # (each worker loads only languages of its profiles)
+    global worker_translations
+    worker_translations = translations
+
+def match_ids(engine,pattern):
+    pattern = re.compile(pattern)
+
+    return [container["userContextId"] for container in engine.ready_conts if pattern.fullmatch(container["name"])]
+
+def process_profile(name,path,options):
+    start = time.perf_counter()
+
+    try:
+        engine = ContainerEngine(worker_translations)
+
+        # gets language from options or from profile
+        language = options["language"]
+        if language is None:
+            try:
+                language = worker_translations.by_code[get_def_language(path)]
+            except (OSError, KeyError):
+                language = worker_translations.by_code["en-US"]
+
+        engine.load(path,language,options["ignore"],bool(options["ignore"]),options["regex"],options["ignore_case"])
+
+        # applies rename rules
+        # (names can differ between containers because of backreferences)
+        for pattern, repl in options["rename"]:
+            pattern = re.compile(pattern)
+            for container in list(engine.ready_conts):
+                if pattern.fullmatch(container["name"]):
+                    engine.change_name([container["userContextId"]],pattern.sub(repl,container["name"]))
+
+        # applies recolor & reicon rules
+        for pattern, color in options["recolor"]:
+            engine.change_color(match_ids(engine,pattern),color)
+        for pattern, icon in options["reicon"]:
+            engine.change_icon(match_ids(engine,pattern),icon)
+
+        if options["sort"] is not None:
+            engine.sort(*options["sort"])
+
+        changed = not engine.is_saved()
+        if changed and not options["dry_run"]:
+            # (name can be a full path, which can't be a part of backup file name)
+            engine.save(BACKUP_UNSAFE_CHARS.sub("_",name))
+
+        return {
+            "name" : name,
+            "containers" : len(engine.ready_conts),
+            "changed" : changed,
+            "time" : time.perf_counter() - start,
+            "error" : None
+        }
+    except Exception:
+        return {
+            "name" : name,
+            "containers" : 0,
+            "changed" : False,
+            "time" : time.perf_counter() - start,
+            "error" : traceback.format_exc()
+        }
+#endregion
+
+def main(args):
+    start = time.perf_counter()
+
+    folder_path = Path(args.folder) if args.folder else FIREFOX_FOLDER_PATH
+    profiles = select_profiles(args.profiles,args.glob,folder_path)
+
+    if not profiles:
+        logging.error("No profiles selected.")
+        return 1
+
+    translations = TranslationStore()
+    with open("config/original_order.json",encoding="utf-8") as f:
+        orig_order = json.load(f)
+
+    # validates options before starting workers
+    if args.language is not None and args.language not in translations:
+        raise ValueError(f"Unknown language: {args.language}")
+    for _, color in args.recolor:
+        if color not in orig_order["color"]:
+            raise ValueError(f"Unknown color: {color}")
+    for _, icon in args.reicon:
+        if icon not in orig_order["icon"]:
+            raise ValueError(f"Unknown icon: {icon}")
+
+    # ignored texts/regexes from --ignore and --ignore-file
+    ignore = [pattern for ignored_str in args.ignore for pattern in split_patterns(ignored_str,args.regex)]
+    if args.ignore_file:
+        with open(args.ignore_file,encoding="utf-8") as f:
+            ignore.extend(line.strip() for line in f if line.strip())
+
+    # sorting options of each profile
+    sort_specs = get_sort_specs(args,profiles)
+
+    options = {
+        "rename" : args.rename,
+        "recolor" : args.recolor,
+        "reicon" : args.reicon,
+        "ignore" : tuple(ignore),
+        "regex" : args.regex,
+        "ignore_case" : args.ignore_case,
+        "language" : args.language,
+        "dry_run" : args.dry_run
+    }
+
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers,initializer=init_worker,initargs=(translations,)) as executor:
+        futures = [executor.submit(process_profile,name,path,dict(options,sort=sort_specs[name])) for name, path in profiles.items()]
+
+        for future in as_completed(futures):
+            res = future.result()
+            results.append(res)
+
+            if res["error"] is None:
+                if not res["changed"]:
+                    status = "unchanged"
+                elif args.dry_run:
+                    status = "changed (dry run)"
+                else:
+                    status = "saved"
+                logging.info(f'{res["name"]}: {res["containers"]} containers, {status} in {res["time"]*1000:.1f} ms')
+            else:
+                logging.error(f'{res["name"]}: failed in {res["time"]*1000:.1f} ms\n{res["error"]}')
+
+    duration = time.perf_counter() - start
+    num_of_conts = sum(res["containers"] for res in results)
+    logging.info(f"Processed {len(results)} profiles ({num_of_conts} containers) in {duration:.3f} s: {len(results)/duration:.1f} profiles/s, {num_of_conts/duration:.0f} containers/s.")
+
+    return 1 if any(res["error"] is not None for res in results) else 0
+
+if __name__ == "__main__":
+    logging.basicConfig(level="INFO",format="%(message)s")
+
+    try:
+        sys.exit(main(batch_parser.parse_args()))
+    except ValueError as e:
+        batch_parser.error(str(e))
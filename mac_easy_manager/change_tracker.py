@@ -0,0 +1,71 @@
+import json
+
+def content_hash(container):
+    # hash of container's keys and values, independent of key order
+    try:
+        return hash(frozenset(container.items()))
+    # unhashable values (lists, dicts)
+    except TypeError:
+        return hash(json.dumps(dict(container.items()),sort_keys=True))
+
+class ChangeTracker:
+    # tracks what changed since containers were loaded/saved
+    # without keeping a copy of them
+    def __init__(self,containers=()):
+        # {userContextId: content hash} at the time of loading/saving
+        self.orig_hashes = {container["userContextId"]: content_hash(container) for container in containers}
+        # {userContextId: position} at the time of loading/saving
+        self.orig_positions = {container["userContextId"]: ind for ind, container in enumerate(containers)}
+
+        # IDs of original containers whose content changed
+        self.changed = set()
+        # IDs of containers that weren't there originally
+        self.added = set()
+        # IDs of original containers that were removed
+        self.deleted = set()
+        # IDs of containers that aren't at their original position
+        self.misplaced = set()
+
+    #region CONTENT
+    def update(self,container):
+        # called after container was edited or (re)added
+        cont_id = container["userContextId"]
+
+        if cont_id not in self.orig_hashes:
+            self.added.add(cont_id)
+            return
+
+        self.deleted.discard(cont_id)
+        if content_hash(container) != self.orig_hashes[cont_id]:
+            self.changed.add(cont_id)
+        else:
+            self.changed.discard(cont_id)
+
+    def remove(self,cont_id):
+        # called after container was removed
+        self.added.discard(cont_id)
+        self.changed.discard(cont_id)
+        self.misplaced.discard(cont_id)
+
+        if cont_id in self.orig_hashes:
+            self.deleted.add(cont_id)
+    #endregion
+
+    #region ORDER
+    def set_position(self,cont_id,position):
+        if self.orig_positions.get(cont_id) == position:
+            self.misplaced.discard(cont_id)
+        else:
+            self.misplaced.add(cont_id)
+
+    def set_positions(self,positions):
+        # positions = {userContextId: position} of all current containers
+        self.misplaced = {cont_id for cont_id, position in positions.items() if self.orig_positions.get(cont_id) != position}
+
+    def is_order_restored(self):
+        # True if the same containers are in the same order as originally
+        return not (self.misplaced or self.added or self.deleted)
+    #endregion
+
+    def is_dirty(self):
+        return bool(self.changed or self.added or self.deleted or self.misplaced)
@@ -0,0 +1,136 @@
+class Missing:
+    # marks optional field that isn't present in identity
+    __slots__ = ()
+
+    def __repr__(self):
+        return "MISSING"
+
+    def __bool__(self):
+        return False
+
+MISSING = Missing()
+
+# known keys of identity, stored in slots
+FIELDS = ("userContextId", "public", "icon", "color", "name", "l10nID", "accessKey")
+FIELDS_SET = frozenset(FIELDS)
+
+# {keys order: same tuple}
+# containers with the same keys in the same order share one tuple
+KEY_ORDERS = {}
+
+def intern_keys(keys):
+    keys = tuple(keys)
+    return KEY_ORDERS.setdefault(keys,keys)
+
+class Container:
+    # single identity from containers.json
+    # known keys are kept in slots instead of a dict per container,
+    # unknown keys (e.g. "telemetryId") go to extras, so that saving writes back everything that was read
+    # supports the dict operations used on identities (container["name"], "accessKey" in container, get, items...)
+    __slots__ = FIELDS + ("extras", "keys_order")
+
+    def __init__(self,userContextId,public,icon,color,name=MISSING,l10nID=MISSING,accessKey=MISSING,extras=None,keys_order=None):
+        self.userContextId = userContextId
+        self.public = public
+        self.icon = icon
+        self.color = color
+        self.name = name
+        self.l10nID = l10nID
+        self.accessKey = accessKey
+        # {key: value} of unknown keys, None if there are none
+        self.extras = extras or None
+
+        # order of keys like in file
+        if keys_order is None:
+            keys_order = [field for field in FIELDS if getattr(self,field) is not MISSING]
+            if self.extras:
+                keys_order.extend(self.extras)
+        self.keys_order = intern_keys(keys_order)
+
+    @classmethod
+    def from_dict(cls,identity):
+        extras = {key: value for key, value in identity.items() if key not in FIELDS_SET}
+
+        container = cls.__new__(cls)
+        for field in FIELDS:
+            setattr(container,field,identity.get(field,MISSING))
+        container.extras = extras or None
+        container.keys_order = intern_keys(identity)
+
+        return container
+
+    def to_dict(self):
+        return {key: self[key] for key in self.keys_order}
+
+    #region DICT METHODS
+    def __getitem__(self,key):
+        if key in FIELDS_SET:
+            value = getattr(self,key)
+            if value is MISSING:
+                raise KeyError(key)
+            return value
+
+        if self.extras is None:
+            raise KeyError(key)
+        return self.extras[key]
+
+    def __setitem__(self,key,value):
+        if key not in self:
+            self.keys_order = intern_keys(self.keys_order + (key,))
+
+        if key in FIELDS_SET:
+            setattr(self,key,value)
+        else:
+            if self.extras is None:
+                self.extras = {}
+            self.extras[key] = value
+
+    def __delitem__(self,key):
+        if key not in self:
+            raise KeyError(key)
+
+        if key in FIELDS_SET:
+            setattr(self,key,MISSING)
+        else:
+            del self.extras[key]
+            if not self.extras:
+                self.extras = None
+
+        self.keys_order = intern_keys(other_key for other_key in self.keys_order if other_key != key)
+
+    def __contains__(self,key):
+        if key in FIELDS_SET:
+            return getattr(self,key) is not MISSING
+
+        return self.extras is not None and key in self.extras
+
+    def get(self,key,default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.keys_order
+
+    def __iter__(self):
+        return iter(self.keys_order)
+
+    def __len__(self):
+        return len(self.keys_order)
+
+    def items(self):
+        return ((key, self[key]) for key in self.keys_order)
+
+    def __eq__(self,other):
+        if isinstance(other,Container):
+            other = other.to_dict()
+        if isinstance(other,dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Container({self.to_dict()!r})"
+    #endregion
@@ -0,0 +1,712 @@
+from configparser import ConfigParser
+from array import array
+from change_tracker import ChangeTracker
+from container import Container
+from container_io import iter_containers, iterencode_containers, write_atomic
+from copy import deepcopy
+from datetime import datetime
+from itertools import chain
+from history import History
+from ignore_matcher import get_matcher, split_patterns
+import json
+from pathlib import Path
+import re
+import shutil
+from threading import Lock
+
+# path to Firefox data folder on Windows
+# C:\Users\{user}\AppData\Roaming\Mozilla\Firefox
+FIREFOX_FOLDER_PATH = Path(Path.home() / Path("AppData", "Roaming", "Mozilla", "Firefox"))
+
+#region PROFILE METHODS
+# results of scanning profiles, reused as long as files don't change
+# (profiles can be on slow network drives)
+# {path of profiles.ini: (mtime, [(name, path, is_default)])}
+profiles_ini_cache = {}
+# {profile folder: (mtime, if containers.json exists)}
+profile_dirs_cache = {}
+profiles_cache_lock = Lock()
+
+def get_mtime(path):
+    # None if file/folder doesn't exist
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+def read_profiles_ini(folder_path=FIREFOX_FOLDER_PATH):
+    # returns all profiles from profiles.ini as list of (name, path, is_default)
+    ini_path = folder_path / "profiles.ini"
+    mtime = get_mtime(ini_path)
+
+    with profiles_cache_lock:
+        cached = profiles_ini_cache.get(ini_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    # gets profiles.ini file from Firefox data folder
+    # if file/folder doesn't exist, ConfigParser handles it internally
+    config = ConfigParser()
+    config.read(ini_path)
+
+    #region FILE STRUCTURE
+    # [Install208046BA024A39CB]
+    # Default=Profiles/asd213.default-release (< PATH TO DEFAULT PROFILE)
+    # Locked=1
+
+    # [Profile2]
+    # Name=something
+    # IsRelative=0
+    # Path=C:\Users\User\1231sad.something
+
+    # [Profile1]
+    # Name=default
+    # IsRelative=1
+    # Path=Profiles/12321asd.default
+    # Default=1 (! THIS DOES NOT CHANGE WITH DEFAULT PROFILE CHANGE)
+    #endregion
+
+    # prevents unbound
+    default = None
+    # gets default profile from [Install] section
+    for section in config.sections():
+        if re.match("Install",section):
+            default = config[section]["Default"]
+            break
+
+    # gets all profiles names and paths from [ProfileN] sections
+    profiles = []
+
+    for section in config.sections():
+        if re.match("Profile",section):
+            # gets path
+            path = config[section]["Path"]
+            # if path is relative, adds full folder path
+            full_path = folder_path / path if config[section]["isRelative"] else Path(path)
+
+            profiles.append((config[section]["Name"], full_path, path==default))
+
+    with profiles_cache_lock:
+        profiles_ini_cache[ini_path] = (mtime, profiles)
+
+    return profiles
+
+def has_containers(prof_path):
+    # checks if profile is not empty
+    # (folder's mtime changes when containers.json is created or removed)
+    mtime = get_mtime(prof_path)
+
+    with profiles_cache_lock:
+        cached = profile_dirs_cache.get(prof_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    result = mtime is not None and Path.exists(prof_path / "containers.json")
+
+    with profiles_cache_lock:
+        profile_dirs_cache[prof_path] = (mtime, result)
+
+    return result
+
+def iter_profiles(folder_path=FIREFOX_FOLDER_PATH):
+    # yields (name, {"path": Path, "is_default": bool}) of profiles with containers, one by one
+    # so that they can be shown as they're found
+    for name, full_path, is_default in read_profiles_ini(folder_path):
+        if has_containers(full_path):
+            yield name, {"path": full_path, "is_default": is_default}
+
+def get_profiles(folder_path=FIREFOX_FOLDER_PATH):
+    # {name: {"path": Path, "is_default": bool}}
+    # profile name is unique
+    return dict(iter_profiles(folder_path))
+
+# user_pref("intl.locale.requested", "en-US,ast")
+LANG_PREF_PATTERN = re.compile(r'user_pref\("intl\.locale\.requested", "(.*?)"\)')
+
+# {profile folder: ((mtime of user.js, mtime of prefs.js), language)}
+languages_cache = {}
+languages_cache_lock = Lock()
+
+def find_lang_pref(pref_path):
+    # reads file line by line and stops at first line with the setting
+    # (prefs.js can be several MB)
+    # returns value of the setting ("en-US,ast"), or None if file doesn't exist or doesn't have the setting
+    try:
+        with open(pref_path,encoding="utf-8") as f:
+            for line in f:
+                # cheap check before regex
+                if "intl.locale.requested" in line:
+                    lang_settings = LANG_PREF_PATTERN.search(line)
+                    if lang_settings is not None:
+                        return lang_settings.group(1)
+    except FileNotFoundError:
+        pass
+
+    return None
+
+def get_def_language(prof_path):
+    # get Firefox's language for given profile
+    # user.js (may not exist) overrides prefs.js, so it's checked first
+    # defaults to en-US
+    prof_path = Path(prof_path)
+    pref_paths = (prof_path / "user.js", prof_path / "prefs.js")
+    mtimes = tuple(get_mtime(pref_path) for pref_path in pref_paths)
+
+    with languages_cache_lock:
+        cached = languages_cache.get(prof_path)
+    if cached is not None and cached[0] == mtimes:
+        return cached[1]
+
+    main_lang = "en-US"
+
+    for pref_path, mtime in zip(pref_paths,mtimes):
+        if mtime is None:
+            continue
+
+        all_langs = find_lang_pref(pref_path)
+        # the setting may not exist if there's only 1 language
+        if all_langs is not None:
+            main_lang = all_langs.split(",")[0]
+            break
+
+    with languages_cache_lock:
+        languages_cache[prof_path] = (mtimes, main_lang)
+
+    return main_lang
+#endregion
+
+# gets container from accessKey of default container
+# userContextPersonal.accesskey -> Personal
+ACCESS_KEY_PATTERN = re.compile(r"userContext(.*)?.accesskey")
+
+class ContainerEngine:
+    # pure-Python model of a single profile's containers
+    # (no Tkinter, so it can be driven from scripts as well as from the GUI)
+    def __init__(self,translations,default_order_path="default_order.json",orig_order_path="config/original_order.json",default_order=None,orig_order=None):
+        # TranslationStore, translations[language] = {container: translation}
+        self.translations = translations
+
+        # loads default & original order, unless they're already parsed
+        # (GUI parses them once and passes them to engine of each opened profile,
+        # default order is then shared, so that saving it is seen by next profiles)
+        self.default_order_path = Path(default_order_path)
+        if default_order is None:
+            with open(self.default_order_path,encoding="utf-8") as f:
+                default_order = json.load(f)
+        self.default_order = default_order
+        # gets current order from default order
+        self.current_order = deepcopy(self.default_order)
+
+        if orig_order is None:
+            with open(orig_order_path,encoding="utf-8") as f:
+                orig_order = json.load(f)
+        self.orig_order = orig_order
+
+        # {"color": {color: rank}, "icon": {icon: rank}}
+        # rebuilt only when current order changes
+        self.ranks = {}
+        self.refresh_ranks("color")
+        self.refresh_ranks("icon")
+
+        self.raw_conts = None
+        self.ready_conts = []
+        self.ignored_conts = []
+        self.last_id = 0
+        self.history = History()
+        self.tracker = ChangeTracker()
+        self.reindex()
+
+    #region INDEX METHODS
+    def reindex(self):
+        # {userContextId: container}
+        self.cont_index = {container["userContextId"]: container for container in self.ready_conts}
+        # {userContextId: position in ready_conts}
+        self.cont_positions = {container["userContextId"]: ind for ind, container in enumerate(self.ready_conts)}
+        self.tracker.set_positions(self.cont_positions)
+
+    def to_ids(self,selections):
+        return {int(selection) for selection in selections}
+
+    def get_container(self,cont_id):
+        return self.cont_index[int(cont_id)]
+    def get_position(self,cont_id):
+        return self.cont_positions[int(cont_id)]
+
+    def swap_conts(self,ind,other_ind):
+        self.ready_conts[ind], self.ready_conts[other_ind] = self.ready_conts[other_ind], self.ready_conts[ind]
+        for position in (ind, other_ind):
+            cont_id = self.ready_conts[position]["userContextId"]
+            self.cont_positions[cont_id] = position
+            self.tracker.set_position(cont_id,position)
+
+    def permute(self,perm,if_undo=False):
+        # perm = compact list of old positions in new order (new_conts[i] = old_conts[perm[i]])
+        if if_undo:
+            conts = [None] * len(self.ready_conts)
+            for new_pos, old_pos in enumerate(perm):
+                conts[old_pos] = self.ready_conts[new_pos]
+            self.ready_conts = conts
+        else:
+            self.ready_conts = [self.ready_conts[old_pos] for old_pos in perm]
+        self.reindex()
+    #endregion
+
+    #region GET METHODS
+    def load(self,prof_path,language,ignored_str="",if_ignored=False,if_regex=False,if_ignore_case=False):
+        # remembers options, so that restore can reload the same way
+        self.sel_prof_path = Path(prof_path)
+        self.language = language
+        self.ignored_str = ignored_str
+        # ignored_str = text from entrybox, or list of patterns/prefixes
+        self.ignored_patterns = split_patterns(ignored_str,if_regex) if isinstance(ignored_str,str) else tuple(ignored_str)
+        self.if_ignored = if_ignored
+        self.if_regex = if_regex
+        self.if_ignore_case = if_ignore_case
+
+        self.get_containers()
+
+    def get_containers(self):
+        # top level of containers.json without identities
+        # (identities are streamed from file one at a time, they're kept only in ready_conts/ignored_conts)
+        self.raw_conts = {}
+
+        #region FILE STRUCTURE
+        # {
+        # "version": 4,
+        # "lastUserContextId": 6,
+        # "identities": [
+        #     {
+        #     "userContextId": 1,
+        #     "public": true,
+        #     "icon": "fingerprint",
+        #     "color": "blue",
+        #     "l10nID": "userContextPersonal.label",
+        #     "accessKey": "userContextPersonal.accesskey",
+        #     "telemetryId": 1
+        #     },
+        #     ...
+        #     {
+        #     "userContextId": 5,
+        #     "public": false,
+        #     "icon": "",
+        #     "color": "",
+        #     "name": "userContextIdInternal.thumbnail",
+        #     "accessKey": ""
+        #     },
+        #     {
+        #     "userContextId": 6,
+        #     "public": true,
+        #     "icon": "dollar",
+        #     "color": "green",
+        #     "name": "Custom"
+        #     }
+        # ]
+        # }
+        #endregion
+
+        # gets matcher for ignored names (cached for the same options)
+        # ignored name = one of prefixes followed by any number of digits
+        # or name matching one of regexes
+        matcher = get_matcher(self.ignored_patterns if self.if_ignored else (),bool(self.if_regex),bool(self.if_ignore_case))
+        # translations of default containers' names
+        translations = self.translations[self.language]
+
+        identities = []
+        public_conts = []
+
+        with open(self.sel_prof_path / "containers.json",encoding="utf-8") as f:
+            for identity in map(Container.from_dict,iter_containers(f,self.raw_conts)):
+                identities.append(identity)
+
+                # non-public identities are always ignored
+                if identity["public"]:
+                    public_conts.append(identity)
+
+                    # adds name to default containers with only AccessKey
+                    # userContextPersonal.accessKey, userContextBanking.accessKey etc.
+                    if "accessKey" in identity:
+                        # translates them to selected language
+                        cont = ACCESS_KEY_PATTERN.search(identity["accessKey"]).group(1)
+
+                        identity["name"] = translations[cont]
+
+        # checks names of all public containers at once
+        if_ignored_lst = iter(matcher.classify([container["name"] for container in public_conts]))
+
+        self.ready_conts = []
+        self.ignored_conts = []
+        for identity in identities:
+            # puts non-public identities and ignored names into ignored_conts list
+            # else appends to main list ready_conts
+            # (both keep order from file)
+            if identity["public"] and not next(if_ignored_lst):
+                self.ready_conts.append(identity)
+            else:
+                self.ignored_conts.append(identity)
+
+        # starts tracking changes and new history
+        self.tracker = ChangeTracker(self.ready_conts)
+        self.history = History()
+
+        self.reindex()
+
+        # gets last ID
+        self.last_id = self.raw_conts["lastUserContextId"]
+
+    def is_saved(self):
+        return not self.tracker.is_dirty()
+
+    def get_changes(self):
+        # gets added/edited containers
+        changed_conts = [self.cont_index[cont_id] for cont_id in self.tracker.changed | self.tracker.added]
+        # gets IDs of deleted containers too
+        deleted_ids = list(self.tracker.deleted)
+
+        return changed_conts, deleted_ids
+    #endregion
+
+    #region SORTING METHODS
+    def sort(self,first_sort,second_sort,reverse_lst):
+        # 3rd sorting option is the remaining one
+        # 0 : name, 1 : color, 2 : icon
+        third_sort = 3 - first_sort - second_sort
+
+        sort_options_lst = [first_sort, second_sort, third_sort]
+
+        # handles reverse sorting
+        # reverse sorting names has to be handled by built-in reverse keyword
+        # sets reverse to True if reverse option for sorting name (0 in options list) is set
+        reverse = bool(reverse_lst[sort_options_lst.index(0)])
+
+        # rank tables for color and icon
+        # if option is unchecked and reverse==True
+        # (because reverse will be handled by reverse keyword in sort, so unchecked options have to be reversed to be sorted normally)
+        # or option is checked and reverse==False
+        # ranks are negated, so that they sort in opposite direction
+        rank_dicts = {}
+        for option, kind in ((1, "color"), (2, "icon")):
+            sign = -1 if bool(reverse_lst[sort_options_lst.index(option)]) != reverse else 1
+            rank_dicts[option] = {item: sign*rank for item, rank in self.ranks[kind].items()}
+
+        color_ranks = rank_dicts[1]
+        icon_ranks = rank_dicts[2]
+
+        # builds tuple key once per container
+        # (name is case insensitive)
+        def get_key(cont):
+            values = (cont["name"].lower(), color_ranks[cont["color"]], icon_ranks[cont["icon"]])
+            return (values[first_sort], values[second_sort], values[third_sort])
+
+        # sorts positions instead of containers, so that only one permutation is kept for undo/redo
+        keys = [get_key(cont) for cont in self.ready_conts]
+        perm = array("i",sorted(range(len(keys)),key=keys.__getitem__,reverse=reverse))
+        del keys
+
+        # records change only if order changed
+        if any(new_pos != old_pos for new_pos, old_pos in enumerate(perm)):
+            self.permute(perm)
+            self.history.record(("sort", perm))
+    #endregion
+
+    #region ORDER METHODS
+    # kind = "color" or "icon"
+    def refresh_ranks(self,kind):
+        # maps item to its position in current order
+        self.ranks[kind] = {item: rank for rank, item in enumerate(self.current_order[kind])}
+
+    def order_move_up(self,kind,selections):
+        order = self.current_order[kind]
+
+        # finds selected items and exchanges them with item above
+        for ind, item in enumerate(order):
+            if item in selections:
+                order[ind], order[ind-1] = order[ind-1], order[ind]
+
+        self.refresh_ranks(kind)
+    def order_move_down(self,kind,selections):
+        order = self.current_order[kind]
+
+        # finds selected items and exchanges them with item below
+        # has to go through list in reverse
+        for item in order[::-1]:
+            if item in selections:
+                ind = order.index(item)
+                order[ind], order[ind+1] = order[ind+1], order[ind]
+
+        self.refresh_ranks(kind)
+
+    def order_reset(self,kind):
+        # makes current order a deepcopy of original order
+        self.current_order[kind] = deepcopy(self.orig_order[kind])
+        self.refresh_ranks(kind)
+    def order_restore(self,kind):
+        # makes current order a deepcopy of default order
+        self.current_order[kind] = deepcopy(self.default_order[kind])
+        self.refresh_ranks(kind)
+    def order_save(self,kind):
+        # deepcopies current order to default order
+        self.default_order[kind] = deepcopy(self.current_order[kind])
+
+        # saves default order to config file
+        with open(self.default_order_path,"w",encoding="utf-8") as f:
+            json.dump(self.default_order,f)
+    #endregion
+
+    #region EDIT CONTAINER METHODS
+    # selections = iterable of userContextIds (as ints or strings, like Treeview item IDs)
+    def cont_move_up(self,selections):
+        ids = self.to_ids(selections)
+        # can't move if top container is selected
+        if not ids or min(self.get_position(cont_id) for cont_id in ids) == 0:
+            return
+
+        self.move_conts(ids,-1)
+        self.history.record(("move", ids, -1))
+    def cont_move_down(self,selections):
+        ids = self.to_ids(selections)
+        # can't move if bottom container is selected
+        if not ids or max(self.get_position(cont_id) for cont_id in ids) == len(self.ready_conts)-1:
+            return
+
+        self.move_conts(ids,1)
+        self.history.record(("move", ids, 1))
+    def cont_move_to(self,selections,index):
+        # moves selected containers as one block (keeping their order)
+        # index = number of not selected containers that end up above the block
+        ids = self.to_ids(selections)
+        if not ids:
+            return
+
+        # only old positions of moved containers are kept for undo/redo
+        positions = array("i",sorted(self.get_position(cont_id) for cont_id in ids))
+        index = max(0,min(index,len(self.ready_conts)-len(positions)))
+
+        # does nothing if block is already there
+        if positions[0] == index and positions[-1] == index+len(positions)-1:
+            return
+
+        self.move_block(positions,index)
+        self.history.record(("move_to", positions, index))
+    def cont_move_to_top(self,selections):
+        self.cont_move_to(selections,0)
+    def cont_move_to_bottom(self,selections):
+        self.cont_move_to(selections,len(self.ready_conts))
+
+    def move_block(self,positions,index):
+        # moves containers at positions (ascending) as one block below index not moved containers
+        # splits containers in a single pass
+        moved = set(positions)
+        block = []
+        rest = []
+        for position, container in enumerate(self.ready_conts):
+            (block if position in moved else rest).append(container)
+
+        self.ready_conts = rest[:index] + block + rest[index:]
+        self.reindex()
+    def unmove_block(self,positions,index):
+        # puts block starting at index back to its old positions
+        end = index + len(positions)
+        block = iter(self.ready_conts[index:end])
+        rest = iter(self.ready_conts[:index] + self.ready_conts[end:])
+
+        moved = set(positions)
+        self.ready_conts = [next(block) if position in moved else next(rest) for position in range(len(self.ready_conts))]
+        self.reindex()
+
+    def move_conts(self,ids,direction):
+        # goes through selected positions starting from the side they're moved to
+        # and exchanges each container with its neighbour
+        for ind in sorted((self.get_position(cont_id) for cont_id in ids),reverse=direction > 0):
+            self.swap_conts(ind,ind+direction)
+
+    def change_name(self,selections,name):
+        # remembers old name (and keys of default containers with their order) of changed containers
+        changes = []
+        for cont_id in self.to_ids(selections):
+            container = self.cont_index[cont_id]
+            if container["name"] == name and "accessKey" not in container:
+                continue
+
+            changes.append((cont_id, container["name"], container.get("l10nID"), container.get("accessKey"), container.keys_order))
+
+        self.rename_conts([cont_id for cont_id, *_ in changes],name)
+
+        if changes:
+            self.history.record(("rename", name, changes))
+    def rename_conts(self,ids,name):
+        for cont_id in ids:
+            container = self.cont_index[cont_id]
+            # if container is default, removes "l10nID" and "accessKey" keys
+            if "accessKey" in container:
+                del container["accessKey"]
+                del container["l10nID"]
+            container["name"] = name
+            self.tracker.update(container)
+
+    def change_color(self,selections,color):
+        self.change_field(selections,"color",color)
+    def change_icon(self,selections,icon):
+        self.change_field(selections,"icon",icon)
+    def change_field(self,selections,field,value):
+        # remembers old values of changed containers
+        changes = []
+        for cont_id in self.to_ids(selections):
+            container = self.cont_index[cont_id]
+            if container[field] != value:
+                changes.append((cont_id, container[field]))
+                container[field] = value
+                self.tracker.update(container)
+
+        if changes:
+            self.history.record(("field", field, value, changes))
+
+    def delete_cont(self,selections):
+        ids = self.to_ids(selections)
+
+        # remembers deleted containers with their positions (in ascending order)
+        deleted = sorted((self.get_position(cont_id), self.cont_index[cont_id]) for cont_id in ids)
+
+        self.remove_conts(ids)
+
+        if deleted:
+            self.history.record(("delete", deleted))
+    def remove_conts(self,ids):
+        self.ready_conts = [container for container in self.ready_conts if container["userContextId"] not in ids]
+        for cont_id in ids:
+            self.tracker.remove(cont_id)
+        self.reindex()
+
+    def add_cont(self,name,color,icon):
+        self.last_id += 1
+
+        temp_con = Container(self.last_id,True,icon,color,name)
+
+        self.append_cont(temp_con)
+        self.history.record(("add", temp_con))
+
+        return self.last_id
+    def append_cont(self,container):
+        self.ready_conts.append(container)
+        self.cont_index[container["userContextId"]] = container
+        self.cont_positions[container["userContextId"]] = len(self.ready_conts)-1
+        self.tracker.update(container)
+        self.tracker.set_position(container["userContextId"],len(self.ready_conts)-1)
+    #endregion
+
+    #region UNDO & REDO METHODS
+    def undo(self):
+        op = self.history.pop_undo()
+        if op is not None:
+            self.apply_op(op,True)
+
+        return op is not None
+    def redo(self):
+        op = self.history.pop_redo()
+        if op is not None:
+            self.apply_op(op,False)
+
+        return op is not None
+
+    def apply_op(self,op,if_undo):
+        kind = op[0]
+
+        # ("sort", old positions in new order)
+        if kind == "sort":
+            _, perm = op
+            self.permute(perm,if_undo)
+
+        # ("move_to", old positions, index)
+        elif kind == "move_to":
+            _, positions, index = op
+            if if_undo:
+                self.unmove_block(positions,index)
+            else:
+                self.move_block(positions,index)
+
+        # ("move", ids, direction)
+        elif kind == "move":
+            _, ids, direction = op
+            self.move_conts(ids,-direction if if_undo else direction)
+
+        # ("rename", name, [(id, old_name, old_l10nID, old_accessKey, old_keys_order)])
+        elif kind == "rename":
+            _, name, changes = op
+            if if_undo:
+                for cont_id, old_name, l10n_id, access_key, keys_order in changes:
+                    container = self.cont_index[cont_id]
+                    container["name"] = old_name
+                    # default containers get their keys back
+                    if access_key is not None:
+                        container["l10nID"] = l10n_id
+                        container["accessKey"] = access_key
+                    # in their original places, so that saved file keeps its layout
+                    container.keys_order = keys_order
+                    self.tracker.update(container)
+            else:
+                self.rename_conts([cont_id for cont_id, *_ in changes],name)
+
+        # ("field", field, value, [(id, old_value)])
+        elif kind == "field":
+            _, field, value, changes = op
+            for cont_id, old_value in changes:
+                container = self.cont_index[cont_id]
+                container[field] = old_value if if_undo else value
+                self.tracker.update(container)
+
+        # ("delete", [(position, container)])
+        elif kind == "delete":
+            _, deleted = op
+            if if_undo:
+                # inserts in ascending order, so that positions are right
+                for position, container in deleted:
+                    self.ready_conts.insert(position,container)
+                    self.tracker.update(container)
+                self.reindex()
+            else:
+                self.remove_conts({container["userContextId"] for _, container in deleted})
+
+        # ("add", container)
+        elif kind == "add":
+            _, container = op
+            if if_undo:
+                self.remove_conts({container["userContextId"]})
+            else:
+                self.append_cont(container)
+    #endregion
+
+    #region SAVE METHODS
+    def save(self,backup_prefix,backup_path=Path("backups"),fsync=True):
+        # removes "name" property if "accessKey" is present
+        # (done per container while encoding, live containers stay untouched)
+        def strip_name(container):
+            identity = container.to_dict()
+            if "accessKey" in identity:
+                identity.pop("name",None)
+            return identity
+
+        # appends ignored containers to ready containers
+        identities_output = chain(map(strip_name,self.ready_conts),map(Container.to_dict,self.ignored_conts))
+
+        # gets top level of raw file
+        # (shallow copy, only lastUserContextId is replaced)
+        output = dict(self.raw_conts)
+        output.setdefault("identities",[])
+        # updates lastUserContextId
+        output["lastUserContextId"] = self.last_id
+
+        # creates backup with name:
+        # {profile}_{DD-MM-YY_HH-MM-SS}.json
+        backup_filename = f'{backup_prefix}_{datetime.now().strftime("%d-%m-%Y_%H-%M-%S")}.json'
+
+        # (batch saves profiles in several processes at once, so folder may be created meanwhile)
+        backup_path.mkdir(parents=True,exist_ok=True)
+
+        shutil.copy(self.sel_prof_path / "containers.json", backup_path / backup_filename)
+
+        # saves file
+        write_atomic(self.sel_prof_path / "containers.json",iterencode_containers(output,identities_output),fsync)
+
+        # marks current state as saved
+        self.tracker = ChangeTracker(self.ready_conts)
+        self.reindex()
+    #endregion
@@ -0,0 +1,180 @@
+import json
+import os
+from pathlib import Path
+import re
+import shutil
+import tempfile
+
+# compact, like the file written by Firefox
+COMPACT_ENCODER = json.JSONEncoder(separators=(",",":"),ensure_ascii=False)
+
+# JSON whitespace
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+# characters that can continue a number
+NUMBER_CHARS = re.compile(r"[0-9.eE+-]*")
+
+#region READING
+class JsonStream:
+    # reads JSON text from a file chunk by chunk
+    # values are decoded one at a time with raw_decode, so only the current chunk
+    # (and the value being decoded) are kept in memory
+    def __init__(self,f,chunk_size=1 << 16):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self,size=None):
+        # drops already consumed text and appends next chunk
+        # returns False at end of file
+        chunk = self.f.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def error(self,msg):
+        return json.JSONDecodeError(msg,self.buffer,self.pos)
+
+    def peek(self):
+        # returns next non-whitespace character ("" at end of file)
+        while True:
+            self.pos = WHITESPACE.match(self.buffer,self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self,chars):
+        # consumes one of given structural characters and returns it
+        char = self.peek()
+        if not char or char not in chars:
+            raise self.error(f"Expecting one of: {chars}")
+
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer,self.pos)
+            except json.JSONDecodeError:
+                # value continues in next chunk
+                # (reads at least as much as already buffered, so long values aren't decoded over and over)
+                if self.fill(max(self.chunk_size,len(self.buffer))):
+                    continue
+                raise
+
+            # a number at the end of buffer can continue in next chunk
+            # (e.g. "-2." is decoded as -2)
+            if type(value) in (int, float) and NUMBER_CHARS.match(self.buffer,end).end() == len(self.buffer) and not self.eof and self.fill():
+                continue
+
+            self.pos = end
+            return value
+
+def iter_containers(f,header):
+    # streams identities of containers.json one at a time
+    # other top-level keys are put into header dict in file order,
+    # "identities" is kept there only as a placeholder (None) to keep keys order on save
+    # header is complete once all identities were consumed
+    stream = JsonStream(f)
+
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+
+    while True:
+        key = stream.value()
+        if not isinstance(key,str):
+            raise stream.error("Expecting property name")
+        stream.expect(":")
+
+        if key == "identities":
+            header[key] = None
+
+            stream.expect("[")
+            if stream.peek() == "]":
+                stream.pos += 1
+            else:
+                while True:
+                    yield stream.value()
+
+                    if stream.expect(",]") == "]":
+                        break
+        else:
+            header[key] = stream.value()
+
+        if stream.expect(",}") == "}":
+            break
+
+    if stream.peek():
+        raise stream.error("Extra data")
+#endregion
+
+#region WRITING
+def iterencode_containers(raw_conts,identities):
+    # encodes containers.json chunk by chunk
+    # raw_conts = top-level object, its "identities" are replaced by given iterable of identities
+    # (so identities can be transformed one at a time while encoding, without copying the whole list)
+    yield "{"
+
+    for index, (key, value) in enumerate(raw_conts.items()):
+        if index:
+            yield ","
+        yield COMPACT_ENCODER.encode(key)
+        yield ":"
+
+        if key == "identities":
+            yield "["
+            for identity_index, identity in enumerate(identities):
+                if identity_index:
+                    yield ","
+                yield from COMPACT_ENCODER.iterencode(identity)
+            yield "]"
+        else:
+            yield from COMPACT_ENCODER.iterencode(value)
+
+    yield "}"
+
+def write_atomic(path,chunks,fsync=True):
+    # writes to a temporary file in the same folder and then replaces the original file with it
+    # so that a crash (or Firefox writing at the same time) never leaves a truncated file
+    path = Path(path)
+
+    fd, temp_path = tempfile.mkstemp(dir=path.parent,prefix=f".{path.name}.",suffix=".tmp")
+    try:
+        with os.fdopen(fd,"w",encoding="utf-8") as f:
+            # writes encoded chunks as they're produced, without building the whole string first
+            for chunk in chunks:
+                f.write(chunk)
+
+            # makes sure data is on disk before replacing
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        # keeps permissions of original file
+        if path.exists():
+            shutil.copymode(path,temp_path)
+
+        os.replace(temp_path,path)
+    except BaseException:
+        # removes temporary file if anything went wrong
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+def write_json_atomic(path,obj,fsync=True):
+    write_atomic(path,COMPACT_ENCODER.iterencode(obj),fsync)
+#endregion
@@ -0,0 +1,38 @@
+from collections import deque
+
+class History:
+    # undo/redo stacks of operations
+    # operations are small tuples describing a change (see ContainerEngine.apply_op)
+    def __init__(self,max_len=200):
+        # oldest operations are dropped, so memory stays bounded
+        self.undo_stack = deque(maxlen=max_len)
+        self.redo_stack = []
+
+    def record(self,op):
+        self.undo_stack.append(op)
+        # new operation makes redo impossible
+        self.redo_stack.clear()
+
+    def pop_undo(self):
+        # returns operation to undo or None
+        if not self.undo_stack:
+            return None
+
+        op = self.undo_stack.pop()
+        self.redo_stack.append(op)
+
+        return op
+    def pop_redo(self):
+        # returns operation to redo or None
+        if not self.redo_stack:
+            return None
+
+        op = self.redo_stack.pop()
+        self.undo_stack.append(op)
+
+        return op
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+    def can_redo(self):
+        return bool(self.redo_stack)
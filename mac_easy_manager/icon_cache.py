@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+import tkinter as tk
+
+def load_image(path):
+    # Tk reads PNG & GIF itself, so Pillow is imported only for other formats (e.g. .ico)
+    # (importing Pillow takes more time than loading all icons)
+    try:
+        return tk.PhotoImage(file=path)
+    except tk.TclError:
+        from PIL import ImageTk
+        return ImageTk.PhotoImage(file=path)
+
+class IconCache:
+    # container icons loaded on first use
+    # name of icon = {color}{icon}, e.g. "bluefingerprint", "toolbarcart"
+    # icons are sliced out of the atlas built by utils/build_icon_atlas.py:
+    # icons > container_icons.png + container_icons.json ({name: [x, y, width, height]})
+    # if there's no atlas (or icon is missing from it), falls back to:
+    # icons > container_icons > {color} > {icon}.png
+    def __init__(self,colors,icon_path=Path("icons","container_icons"),atlas_path=Path("icons","container_icons.png"),offsets_path=Path("icons","container_icons.json")):
+        self.colors = colors
+        self.icon_path = icon_path
+        self.atlas_path = atlas_path
+
+        # {name: PhotoImage}
+        # has to keep references, otherwise Tkinter images get garbage collected
+        self.images = {}
+
+        # atlas image is decoded when first icon is needed
+        self.atlas = None
+        self.offsets = {}
+        if atlas_path.exists() and offsets_path.exists():
+            with open(offsets_path,encoding="utf-8") as f:
+                self.offsets = json.load(f)
+
+    def split_name(self,name):
+        # no color name is a prefix of another one
+        for color in self.colors:
+            if name.startswith(color):
+                return color, name[len(color):]
+
+        raise KeyError(name)
+
+    def load_from_atlas(self,name):
+        if self.atlas is None:
+            self.atlas = load_image(self.atlas_path)
+
+        x, y, width, height = self.offsets[name]
+
+        # copies region of atlas to new image
+        image = tk.PhotoImage(width=width,height=height)
+        image.tk.call(image,"copy",self.atlas,"-from",x,y,x+width,y+height)
+
+        return image
+
+    def __getitem__(self,name):
+        image = self.images.get(name)
+
+        if image is None:
+            if name in self.offsets:
+                image = self.load_from_atlas(name)
+            else:
+                color, icon = self.split_name(name)
+                image = load_image(self.icon_path / color / f"{icon}.png")
+
+            self.images[name] = image
+
+        return image
@@ -0,0 +1,63 @@
+from functools import lru_cache
+import re
+
+# digits at the end of name, e.g. "tmp12" -> "12"
+TRAILING_DIGITS = re.compile(r"\d*$")
+
+def split_patterns(ignored_str,if_regex=False):
+    # plain text can hold many comma-separated prefixes ("tmp, temp")
+    # regular expression is taken as a whole (it can contain commas and use | itself)
+    if if_regex:
+        return (ignored_str,) if ignored_str else ()
+
+    return tuple(prefix.strip() for prefix in ignored_str.split(",") if prefix.strip())
+
+class IgnoreMatcher:
+    # decides which container names are ignored
+    # plain text: name = one of prefixes followed by any number of digits
+    # regex: name fully matches one of patterns
+    def __init__(self,patterns,if_regex=False,if_ignore_case=False):
+        self.patterns = tuple(patterns)
+        self.if_regex = if_regex
+        self.if_ignore_case = if_ignore_case
+
+        if if_regex:
+            # all patterns in one alternation, so each name is matched once
+            self.regex = re.compile("|".join(f"(?:{pattern})" for pattern in self.patterns),re.I if if_ignore_case else 0) if self.patterns else None
+        else:
+            # prefixes are looked up in a set instead of being tried one by one,
+            # so that hundreds of prefixes are as fast as one
+            self.prefixes = frozenset(self.normalize(prefix) for prefix in self.patterns)
+
+    def normalize(self,name):
+        return name.lower() if self.if_ignore_case else name
+
+    def matches(self,name):
+        if self.if_regex:
+            return self.regex is not None and self.regex.fullmatch(name) is not None
+
+        if not self.prefixes:
+            return False
+
+        # name without trailing digits, or with some of them, has to be one of prefixes
+        # "tmp12" -> "tmp", "tmp1", "tmp12"
+        name = self.normalize(name)
+        for end in range(TRAILING_DIGITS.search(name).start(),len(name)+1):
+            if name[:end] in self.prefixes:
+                return True
+
+        return False
+
+    def classify(self,names):
+        # returns list of bools (True = ignored) for all names at once
+        if not self.patterns:
+            return [False] * len(names)
+
+        matches = self.matches
+        return [matches(name) for name in names]
+
+@lru_cache(maxsize=32)
+def get_matcher(patterns,if_regex=False,if_ignore_case=False):
+    # matchers are reused when the same options are loaded again
+    # (e.g. restoring containers or loading many profiles in batch mode)
+    return IgnoreMatcher(patterns,if_regex,if_ignore_case)
@@ -0,0 +1,66 @@
+from container_engine import ACCESS_KEY_PATTERN
+from container_io import iter_containers
+from ignore_matcher import get_matcher, split_patterns
+from pathlib import Path
+import re
+from threading import Lock
+
+# {path of containers.json: ((mtime, size), [(name, default container)])}
+# default container = e.g. "Personal" for default containers (translated when previewing), else None
+names_cache = {}
+names_cache_lock = Lock()
+
+def get_public_names(prof_path):
+    # names of public containers from containers.json
+    # parsed again only if file changed since last time
+    path = Path(prof_path) / "containers.json"
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    with names_cache_lock:
+        cached = names_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    names = []
+    with open(path,encoding="utf-8") as f:
+        for identity in iter_containers(f,{}):
+            # hand-edited file can have containers without name, accessKey not matching etc.
+            # (reported as error instead of failing in preview thread)
+            try:
+                if identity["public"]:
+                    if "accessKey" in identity:
+                        names.append((None, ACCESS_KEY_PATTERN.search(identity["accessKey"]).group(1)))
+                    elif isinstance(identity["name"],str):
+                        names.append((identity["name"], None))
+                    else:
+                        raise TypeError("name is not a text")
+            except (KeyError, TypeError, AttributeError):
+                raise ValueError(f"Invalid container: {identity!r:.80}")
+
+    with names_cache_lock:
+        names_cache[path] = (key, names)
+
+    return names
+
+def preview_ignored(prof_path,translations,ignored_str,if_regex=False,if_ignore_case=False,sample_size=5):
+    # counts ignored and kept containers with given ignore options
+    # returns {"ignored": int, "kept": int, "ignored_sample": [names], "kept_sample": [names], "error": None or message}
+    # runs outside of Tk thread, so it doesn't touch any widgets
+    result = {"ignored": 0, "kept": 0, "ignored_sample": [], "kept_sample": [], "error": None}
+
+    try:
+        names = [name if default is None else translations.get(default,default) for name, default in get_public_names(prof_path)]
+        matcher = get_matcher(split_patterns(ignored_str,if_regex),bool(if_regex),bool(if_ignore_case))
+    # invalid regex (while typing) or unreadable file
+    except (re.error, OSError, ValueError) as e:
+        result["error"] = str(e)
+        return result
+
+    for name, if_ignored in zip(names,matcher.classify(names)):
+        kind = "ignored" if if_ignored else "kept"
+        result[kind] += 1
+        if len(result[f"{kind}_sample"]) < sample_size:
+            result[f"{kind}_sample"].append(name)
+
+    return result
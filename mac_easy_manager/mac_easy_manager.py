@@ -1,14 +1,18 @@
-from configparser import ConfigParser
-from copy import deepcopy
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from container_engine import ContainerEngine, FIREFOX_FOLDER_PATH, iter_profiles, get_def_language
+from icon_cache import IconCache, load_image
+from ignore_preview import preview_ignored
 import json
-from pathlib import Path
-from PIL import ImageTk
-import re
-import shutil
+import queue
+from sort_presets import DEFAULT_PRESET, SortPresets
+from startup_profiler import NullProfiler
+from threading import Thread
 import tkinter as tk
 from tkinter import ttk, messagebox
 import traceback
+from translation_store import TranslationStore
+from treeview_sync import TreeviewSync
+from virtual_treeview import VirtualTreeview
 
 #region EXCEPTION HANDLER
 # taken from here: https://mail.python.org/pipermail/python-list/2001-March/104202.html
@@ -27,18 +31,31 @@ class TkErrorCatcher:
 tk.CallWrapper = TkErrorCatcher
 #endregion
 
+# time (ms) after last change of ignore options before preview is computed
+IGNORE_PREVIEW_DELAY = 300
+# how often (ms) to check if preview is ready
+IGNORE_PREVIEW_POLL = 50
+# how often (ms) to check for newly found profiles
+PROFILE_SCAN_POLL = 50
+
 class MACEasyManager:
-    def __init__(self):
+    def __init__(self,profiler=None):
+        # measures startup phases with --profile-startup
+        self.profiler = profiler or NullProfiler()
+
         # path to Firefox data folder on Windows
         # C:\Users\{user}\AppData\Roaming\Mozilla\Firefox
-        self.folder_path = Path(Path.home() / Path("AppData", "Roaming", "Mozilla", "Firefox"))
+        self.folder_path = FIREFOX_FOLDER_PATH
 
         # Tkinter init
+        self.profiler.phase("tk_init")
         self.root = tk.Tk()
 
         self.root.title("MAC Easy Manager")
 
-        icon = ImageTk.PhotoImage(file="icons/icon.ico")
+        self.profiler.phase("window_icon")
+        # PNG copy of icon.ico, so that Pillow isn't needed to read it
+        icon = load_image("icons/icon.png")
         self.root.iconphoto(True,icon) # True to be default for all toplevels
 
         # get system resolution to position window
@@ -46,18 +63,37 @@ class MACEasyManager:
         self.screen_height=self.root.winfo_screenheight()
 
         # load GUI vars from file
+        self.profiler.phase("gui_config")
         with open("config/gui_config.json",encoding="utf-8") as f:
             self.gui_vars = json.load(f)
 
+        # computes preview of ignored containers outside of Tk thread
+        self.preview_executor = ThreadPoolExecutor(max_workers=1)
+        self.ignore_preview_future = None
+        self.ignore_preview_after = None
+
+        # main window is built when first profile is opened
+        # and then reused for other profiles
+        self.if_main_built = False
+
+        self.profiler.phase("profile_select_window")
         self.profile_select_window()
-        self.root.focus_force() # to focus after reinitialization
+        self.profiler.phase("show_profile_select")
+        self.show_profile_select()
+        self.root.focus_force()
+
+    def run(self):
+        # separate from __init__, so that utils/benchmark.py can drive the GUI without mainloop
+        # until window is drawn and waits for user
+        self.profiler.phase("first_frame")
+        self.root.after_idle(self.profiler.milestone,"first_frame")
         self.root.mainloop()
 
     #region GUI METHODS
     def profile_select_window(self):
         # frame
+        # (packed in show_profile_select)
         self.profile_select_frame = tk.Frame(self.root)
-        self.profile_select_frame.pack(padx=self.gui_vars["pad"]["x"],pady=self.gui_vars["pad"]["y"])
 
         # header
         tk.Label(self.profile_select_frame,text=self.gui_vars["text"]["profile_select_window"]["header"],font=self.gui_vars["font"]["header"]).pack(pady=self.gui_vars["pad"]["y"])
@@ -69,33 +105,19 @@ class MACEasyManager:
         ttk.Separator(self.profile_select_frame, orient="horizontal").pack(fill="x",pady=self.gui_vars["pad"]["y"])
 
         #region RADIOBUTTONS
-        self.get_profiles()
+        # radiobuttons are added to this frame as profiles are found
+        self.profile_radiobtn_frame = tk.Frame(self.profile_select_frame)
+        self.profile_radiobtn_frame.pack()
 
-        # before if because used by get_def_languages
+        # before scanning because used by get_def_languages
         self.profile_radiobtn_var = tk.StringVar()
-        # if no profiles found
-        if not self.prof_dict:
-            tk.Label(self.profile_select_frame,text=self.gui_vars["text"]["profile_select_window"]["no_profs"],font=self.gui_vars["font"]["normal"],fg=self.gui_vars["color"]["warn"]).pack()
-        # if there are profiles
-        else:
-            # in case default profile is empty
-            # make default button the 1st one
-            default_button = list(self.prof_dict.keys())[0]
-
-            # creates buttons
-            for profile in self.prof_dict:
-                cur_btn = tk.Radiobutton(self.profile_select_frame,variable=self.profile_radiobtn_var,value=profile,text=profile,font=self.gui_vars["font"]["normal"],command=self.get_def_language)
-
-                # if profile is default, makes text bold
-                if self.prof_dict[profile]["is_default"]:
-                    cur_btn.config(font=self.gui_vars["font"]["default_profile"])
+        # {name: {"path": Path, "is_default": bool}}
+        self.prof_dict = {}
+        # once user clicks a profile, default profile found later isn't selected instead
+        self.if_profile_chosen = False
 
-                    default_button = profile
-
-                cur_btn.pack()
-
-            # invokes default button
-            self.profile_radiobtn_var.set(default_button)
+        # profiles are looked for in show_profile_select
+        self.profile_scan_after = None
         #endregion
 
         # separator
@@ -103,17 +125,9 @@ class MACEasyManager:
 
         # Select button
         # continues to main window
-        # is focused on start
-        select_button = tk.Button(self.profile_select_frame,text=self.gui_vars["text"]["button"]["select"],font=self.gui_vars["font"]["normal"],command=self.main_window)
-        select_button.pack()
-
-        # if there are no profiles, disable the button
-        if not self.profile_radiobtn_var.get():
-            select_button.config(state="disabled")
-        else:
-            select_button.focus()
-            # binds Enter to button action
-            self.root.bind("<Return>",lambda *_: select_button.invoke())
+        # disabled until first profile is found, then focused
+        self.select_button = tk.Button(self.profile_select_frame,text=self.gui_vars["text"]["button"]["select"],font=self.gui_vars["font"]["normal"],command=self.main_window,state="disabled")
+        self.select_button.pack()
 
         #region IGNORE CONTAINERS OPTION
         # frame
@@ -123,7 +137,7 @@ class MACEasyManager:
         # checkbutton
         self.if_ignored = tk.IntVar()
 
-        ignore_button = tk.Checkbutton(ignore_frame,text=self.gui_vars["text"]["button"]["ignore"],font=self.gui_vars["font"]["normal"],variable=self.if_ignored)
+        ignore_button = tk.Checkbutton(ignore_frame,text=self.gui_vars["text"]["button"]["ignore"],font=self.gui_vars["font"]["normal"],variable=self.if_ignored,command=self.schedule_ignore_preview)
         ignore_button.pack(side="left",pady=self.gui_vars["pad"]["y"])
 
         ignore_button.invoke()
@@ -134,19 +148,25 @@ class MACEasyManager:
         # default ignored container: "tmp"
         # from Temporary Containers extension
         self.ignore_entrybox.insert(0,"tmp")
+        # updates preview when typing
+        self.ignore_entrybox.bind("<KeyRelease>",self.schedule_ignore_preview)
 
         # regex checkbutton
         self.if_regex = tk.IntVar()
 
-        tk.Checkbutton(self.profile_select_frame,text=self.gui_vars["text"]["button"]["regex"],font=self.gui_vars["font"]["small_text"],variable=self.if_regex).pack()
+        tk.Checkbutton(self.profile_select_frame,text=self.gui_vars["text"]["button"]["regex"],font=self.gui_vars["font"]["small_text"],variable=self.if_regex,command=self.schedule_ignore_preview).pack()
 
         # ignore case checkbutton
         self.if_ignore_case = tk.IntVar()
 
-        tk.Checkbutton(self.profile_select_frame,text=self.gui_vars["text"]["button"]["ignore_case"],font=self.gui_vars["font"]["small_text"],variable=self.if_ignore_case).pack()
+        tk.Checkbutton(self.profile_select_frame,text=self.gui_vars["text"]["button"]["ignore_case"],font=self.gui_vars["font"]["small_text"],variable=self.if_ignore_case,command=self.schedule_ignore_preview).pack()
         
         # info about ignore
         tk.Label(self.profile_select_frame,text=self.gui_vars["text"]["profile_select_window"]["ignore_info"],font=self.gui_vars["font"]["small_text"],fg=self.gui_vars["color"]["small_text"]).pack(pady=self.gui_vars["pad"]["y"])
+
+        # preview of ignored and kept containers of selected profile
+        self.ignore_preview_label = tk.Label(self.profile_select_frame,font=self.gui_vars["font"]["small_text"],fg=self.gui_vars["color"]["small_text"])
+        self.ignore_preview_label.pack()
         #endregion
 
         #region LANGUAGE SELECT OPTION
@@ -154,24 +174,40 @@ class MACEasyManager:
         ttk.Separator(self.profile_select_frame, orient="horizontal").pack(fill="x",pady=self.gui_vars["pad"]["y"])
 
         # option menu
-        with open("config/container_translations.json",encoding="utf-8") as f:
-            self.translation_data = json.load(f)
-        
+        # only list of languages is loaded here, translations of language are loaded when it's used
+        self.profiler.phase("translations")
+        self.translations = TranslationStore()
+        self.profiler.phase("language_select")
+
         self.language_select_var = tk.StringVar()
 
-        self.language_select = ttk.Combobox(self.profile_select_frame,textvariable=self.language_select_var,values=list(self.translation_data["by_name"].keys()),state="readonly")
+        self.language_select = ttk.Combobox(self.profile_select_frame,textvariable=self.language_select_var,values=self.translations.languages(),state="readonly")
         self.language_select.config(font=self.gui_vars["font"]["normal"])
         self.language_select.pack(pady=self.gui_vars["pad"]["y"])
 
         # perform function on load
         self.get_def_language()
 
+        # updates preview when profile or language changes
+        # (default containers' names depend on language)
+        self.profile_radiobtn_var.trace_add("write",self.schedule_ignore_preview)
+        self.language_select_var.trace_add("write",self.schedule_ignore_preview)
+
         # info
         tk.Label(self.profile_select_frame,text=self.gui_vars["text"]["profile_select_window"]["language_select_info_1"],font=self.gui_vars["font"]["small_text"],fg=self.gui_vars["color"]["small_text"]).pack(pady=self.gui_vars["pad"]["y"])
         tk.Label(self.profile_select_frame,text=self.gui_vars["text"]["profile_select_window"]["language_select_info_2"],font=self.gui_vars["font"]["small_text"],fg=self.gui_vars["color"]["small_text"]).pack()
         #endregion
+    def show_profile_select(self):
+        self.profile_select_frame.pack(padx=self.gui_vars["pad"]["x"],pady=self.gui_vars["pad"]["y"])
+
+        # looks for profiles in background thread
+        # (profile folders may be on slow network drives, and may have changed since last time)
+        self.start_profile_scan()
+        self.schedule_ignore_preview()
 
         #region WINDOW POSITION
+        # resets size set for main window
+        self.root.geometry("")
         # get window size
         self.root.update_idletasks() #update idletasks to get correct size
         win_width=self.root.winfo_width()
@@ -191,33 +227,58 @@ class MACEasyManager:
         # removes profile selection window
         self.profile_select_frame.pack_forget()
 
-        # gets path of selected profile
-        self.sel_prof_path = self.prof_dict[self.profile_radiobtn_var.get()]["path"]
+        # stops adding found profiles
+        if self.profile_scan_after is not None:
+            self.root.after_cancel(self.profile_scan_after)
+            self.profile_scan_after = None
+
+        # stops updating ignore preview
+        self.cancel_ignore_preview()
+
+        # gets name and path of selected profile
+        self.sel_prof_name = self.profile_radiobtn_var.get()
+        self.sel_prof_path = self.prof_dict[self.sel_prof_name]["path"]
+        # stays selected when going back to profile selection
+        self.if_profile_chosen = True
 
         # gets ignored container name
         self.ignored_str = self.ignore_entrybox.get()
 
-        # loads container icons
-        self.icon_imgs = {}
-        icon_path = Path("icons", "container_icons")
-        # icons > container_icons > {color} > {icon}.png
-        for icon_folder in icon_path.iterdir():
-            for icon in icon_folder.iterdir():
-                # name of icon = {color}{icon}
-                self.icon_imgs[f"{icon_folder.name}{icon.stem}"] = ImageTk.PhotoImage(file=icon)
-
-        # loads default order
+        # widgets are created only once
+        # (also parses default & original order)
+        if not self.if_main_built:
+            self.profiler.phase("main_window_widgets")
+            self.build_main_window()
+            self.if_main_built = True
+
+        # creates container engine
+        # new one for every opened profile, with already parsed default & original order
+        self.profiler.phase("container_engine")
+        self.engine = ContainerEngine(self.translations,default_order=self.default_order,orig_order=self.orig_order)
+
+        self.open_profile()
+
+        # until main window is drawn
+        self.profiler.phase("main_window_frame")
+        self.root.after_idle(self.profiler.milestone,"main_window_ready")
+    def build_main_window(self):
+        # default & original order of colors & icons, parsed once for all profiles
         with open("default_order.json",encoding="utf-8") as f:
             self.default_order = json.load(f)
-            # gets current order from default order
-            self.current_order = deepcopy(self.default_order)
         with open("config/original_order.json",encoding="utf-8") as f:
             self.orig_order = json.load(f)
 
+        # container icons, loaded when first shown
+        # name of icon = {color}{icon}
+        self.icon_imgs = IconCache(self.orig_order["color"])
+
+        # sorting presets, read once and kept for all opened profiles
+        self.sort_presets = SortPresets()
+
         #region GUI
         # supermain frame to center content
+        # (packed in open_profile)
         self.super_frame = tk.Frame(self.root)
-        self.super_frame.pack()
 
         # main frames
         # canvas to add scrollbar
@@ -257,11 +318,10 @@ class MACEasyManager:
         tk.Label(self.containers_frame,text=self.gui_vars["text"]["main_window"]["containers"],font=self.gui_vars["font"]["header"]).grid(**self.gui_vars["grid"]["containers_frame"]["title"])
 
         # treeview
-        # selectmode:
-        # extended = multiple selections
-        # show:
-        # tree = without header
-        self.cont_treeview = ttk.Treeview(self.containers_frame,height=13,selectmode="extended",show="tree")
+        # only visible rows are created and reused while scrolling,
+        # so that long lists of containers don't create thousands of items
+        # multiple selections like in Treeview with selectmode="extended"
+        self.cont_treeview = VirtualTreeview(self.containers_frame,self.icon_imgs,height=13)
         self.cont_treeview.grid(**self.gui_vars["grid"]["containers_frame"]["treeview"])
 
         # binds selecting item in treeview to enable current container edit box and disable move up/down button if 1st or last item selected
@@ -280,8 +340,18 @@ class MACEasyManager:
         self.cont_treeview.config(yscrollcommand = self.cont_treeview_scrollbar.set)
         self.cont_treeview_scrollbar.config(command = self.cont_treeview.yview)
 
-        # move up and down buttons
+        # binds dragging containers to move them
+        self.cont_treeview.bind("<ButtonPress-1>",self.cont_drag_start)
+        self.cont_treeview.bind("<B1-Motion>",self.cont_drag_motion)
+        self.cont_treeview.bind("<ButtonRelease-1>",self.cont_drag_drop)
+        self.cont_drag_item = None
+
+        # move to top, up, down and to bottom buttons
         # disabled at start
+        self.cont_move_top_btn=tk.Button(self.containers_frame,text=self.gui_vars["text"]["button"]["move_top"],font=self.gui_vars["font"]["normal"],command=self.cont_move_top)
+        self.cont_move_top_btn.config(state="disabled")
+        self.cont_move_top_btn.grid(**self.gui_vars["grid"]["containers_frame"]["move_top"])
+
         self.cont_move_up_btn=tk.Button(self.containers_frame,text=self.gui_vars["text"]["button"]["move_up"],font=self.gui_vars["font"]["normal"],command=self.cont_move_up)
         self.cont_move_up_btn.config(state="disabled") 
         self.cont_move_up_btn.grid(**self.gui_vars["grid"]["containers_frame"]["move_up"])
@@ -290,6 +360,21 @@ class MACEasyManager:
         self.cont_move_down_btn.config(state="disabled") 
         self.cont_move_down_btn.grid(**self.gui_vars["grid"]["containers_frame"]["move_down"])
 
+        self.cont_move_bottom_btn=tk.Button(self.containers_frame,text=self.gui_vars["text"]["button"]["move_bottom"],font=self.gui_vars["font"]["normal"],command=self.cont_move_bottom)
+        self.cont_move_bottom_btn.config(state="disabled")
+        self.cont_move_bottom_btn.grid(**self.gui_vars["grid"]["containers_frame"]["move_bottom"])
+
+        # Undo & Redo buttons
+        # disabled at start
+        self.undo_redo_frame = tk.Frame(self.containers_frame)
+        self.undo_redo_frame.grid(**self.gui_vars["grid"]["containers_frame"]["undo_redo"])
+
+        self.undo_btn = tk.Button(self.undo_redo_frame,text=self.gui_vars["text"]["button"]["undo"],font=self.gui_vars["font"]["normal"],state="disabled",command=self.cont_undo)
+        self.undo_btn.pack(side="left",padx=self.gui_vars["pad"]["x"])
+
+        self.redo_btn = tk.Button(self.undo_redo_frame,text=self.gui_vars["text"]["button"]["redo"],font=self.gui_vars["font"]["normal"],state="disabled",command=self.cont_redo)
+        self.redo_btn.pack(side="left",padx=self.gui_vars["pad"]["x"])
+
         # Restore original order button
         tk.Button(self.containers_frame,text=self.gui_vars["text"]["button"]["restore_cont"],font=self.gui_vars["font"]["normal"],command=self.cont_restore).grid(**self.gui_vars["grid"]["containers_frame"]["restore"])
 
@@ -366,10 +451,29 @@ class MACEasyManager:
         self.save_sorting_frame = tk.Frame(self.sorting_options_frame)
         self.save_sorting_frame.pack(padx=self.gui_vars["pad"]["main_x"],pady=self.gui_vars["pad"]["main_y"])
 
+        # preset name
+        # (one of saved presets, or new name to save current options as)
+        tk.Label(self.save_sorting_frame,text=self.gui_vars["text"]["main_window"]["sort_preset"],font=self.gui_vars["font"]["normal"]).pack()
+
+        self.sort_preset_var = tk.StringVar(value=DEFAULT_PRESET)
+
+        self.sort_preset_select = ttk.Combobox(self.save_sorting_frame,textvariable=self.sort_preset_var,values=self.sort_presets.names())
+        self.sort_preset_select.config(font=self.gui_vars["font"]["normal"])
+        self.sort_preset_select.pack(pady=self.gui_vars["pad"]["y"])
+        # shows if chosen preset is the one bound to profile
+        self.sort_preset_select.bind("<<ComboboxSelected>>",self.sort_preset_handle_select)
+
         tk.Button(self.save_sorting_frame,text=self.gui_vars["text"]["button"]["save_options"],font=self.gui_vars["font"]["normal"],command=self.save_sorting_options).pack(pady=self.gui_vars["pad"]["y"])
 
         tk.Button(self.save_sorting_frame,text=self.gui_vars["text"]["button"]["load_options"],font=self.gui_vars["font"]["normal"],command=self.sort_opts_restore).pack(pady=self.gui_vars["pad"]["y"])
 
+        tk.Button(self.save_sorting_frame,text=self.gui_vars["text"]["button"]["delete_options"],font=self.gui_vars["font"]["normal"],command=self.delete_sorting_options).pack(pady=self.gui_vars["pad"]["y"])
+
+        # applies preset automatically when this profile is opened
+        self.if_preset_bound = tk.IntVar()
+
+        tk.Checkbutton(self.save_sorting_frame,text=self.gui_vars["text"]["button"]["bind_options"],font=self.gui_vars["font"]["normal"],variable=self.if_preset_bound,command=self.bind_sorting_options).pack()
+
         self.sort_saved_label = tk.Label(self.save_sorting_frame,font=self.gui_vars["font"]["normal"])
         self.sort_saved_label.pack(pady=self.gui_vars["pad"]["y"])
 
@@ -390,6 +494,7 @@ class MACEasyManager:
         # tree = without header
         self.color_treeview = ttk.Treeview(self.color_frame,height=13,selectmode="extended",show="tree")
         self.color_treeview.grid(**self.gui_vars["grid"]["containers_frame"]["treeview"])
+        self.color_tree_sync = TreeviewSync(self.color_treeview,self.icon_imgs)
 
         # binds selecting item in treeview to enable current container edit box and disable move up/down button if 1st or last item selected
         self.color_treeview.bind("<<TreeviewSelect>>",self.color_handle_select)
@@ -433,6 +538,7 @@ class MACEasyManager:
         # tree = without header
         self.icon_treeview = ttk.Treeview(self.icon_frame,height=13,selectmode="extended",show="tree")
         self.icon_treeview.grid(**self.gui_vars["grid"]["containers_frame"]["treeview"])
+        self.icon_tree_sync = TreeviewSync(self.icon_treeview,self.icon_imgs)
 
         # binds selecting item in treeview to enable current container edit box and disable move up/down button if 1st or last item selected
         self.icon_treeview.bind("<<TreeviewSelect>>",self.icon_handle_select)
@@ -556,8 +662,6 @@ class MACEasyManager:
         # Add a new container
         self.add_button = tk.Button(self.del_add_btns_frame,text=self.gui_vars["text"]["button"]["add"],font=self.gui_vars["font"]["normal"],command=self.add_cont)
         self.add_button.pack(side="left",padx=self.gui_vars["pad"]["x"])
-        # sets focus to button
-        self.add_button.focus()
         #endregion
         #endregion
         #region SAVE & BACK BUTTON
@@ -579,17 +683,55 @@ class MACEasyManager:
         self.root.bind_all("<Button-1>",lambda event: event.widget.focus_set())
         self.change_name_entry.bind("<FocusIn>",self.toggle_bind_entrybox)
         self.change_name_entry.bind("<FocusOut>",self.toggle_bind_entrybox)
+
+        # handle quitting program
+        self.root.protocol("WM_DELETE_WINDOW",self.close)
+    def open_profile(self):
+        # shows main window for the profile loaded by self.engine
+        self.profiler.phase("open_profile")
+        self.super_frame.pack()
+
+        # clears containers of previous profile (and their selection)
+        self.cont_treeview.set_items([])
+
+        # resets Current container left from previous profile
+        # (clearing doesn't fire cont_handle_select)
+        self.cur_cont_icon.config(image="")
+        self.cur_cont_name.config(text=self.gui_vars["text"]["main_window"]["cur_cont_name"])
+
+        # empties and disables Change name entrybox
+        # (variable is set, because disabled entrybox can't be edited)
+        self.change_name_var.set("")
+        self.change_name_entry.config(state="disabled")
+
+        # disables Change color/icon, Delete and move buttons
+        for btn in self.change_color_lst + self.change_icon_lst + [self.del_button, self.cont_move_top_btn, self.cont_move_up_btn, self.cont_move_down_btn, self.cont_move_bottom_btn]:
+            btn.config(state="disabled")
+
+        # resets sorting options
+        self.prim_sort.set(None)
+        self.sec_sort.set(None)
+        for btn in self.sec_sort_lst:
+            btn.config(state="disabled")
+        for var in self.reverse_lst:
+            var.set(0)
+
         # calls initial toggle_bind_entrybox/treeview
+        # (also sets focus to Add a new container button)
         self.if_toggled_entrybox = True
         self.toggle_bind_entrybox()
         self.if_toggled_treeview = False
         self.toggle_bind_treeview()
 
         # perform start-up methods
+        self.profiler.phase("get_containers")
         self.get_containers()
+        # (container icons are loaded here when first shown)
+        self.profiler.phase("refresh")
         self.refresh_conts()
         self.refresh_colors()
         self.refresh_icons()
+        self.profiler.phase("window_position")
 
         # removes selection from container treeview
         # (because at start if_added gets triggered because start length = 0)
@@ -597,9 +739,27 @@ class MACEasyManager:
         # scroll to top
         self.cont_treeview.yview_moveto(0)
 
+        # removes selection of colors & icons left from previous profile
+        # (only if there is one, because removing fires color/icon_handle_select)
+        if self.color_treeview.selection():
+            self.color_treeview.selection_remove(self.color_treeview.selection())
+        if self.icon_treeview.selection():
+            self.icon_treeview.selection_remove(self.icon_treeview.selection())
+
         # marks as saved
         self.if_saved = True
 
+        # applies sorting preset bound to profile
+        # (presets are already in memory, so no file is read)
+        preset_name = self.sort_presets.get_binding(self.sel_prof_path)
+        self.if_preset_bound.set(int(preset_name is not None))
+        if preset_name is not None:
+            self.sort_preset_var.set(preset_name)
+            self.apply_sorting_options(self.sort_presets[preset_name])
+        # (preset of previous profile isn't kept)
+        else:
+            self.sort_preset_var.set(DEFAULT_PRESET)
+
         #region WINDOW POSITION
         # get size of wrapper frame
         self.wrapper_frame.update_idletasks()
@@ -621,9 +781,6 @@ class MACEasyManager:
         self.main_frame.config(width=win_width,height=win_height)
         #endregion
 
-        # handle quitting program
-        self.root.protocol("WM_DELETE_WINDOW",self.close)
-
     def toggle_bind_entrybox(self,*_):
         # if Change name entrybox is unfocused
         if self.if_toggled_entrybox:
@@ -642,6 +799,10 @@ class MACEasyManager:
             # (works even before 1st selection, because button is disabled)
             self.root.bind("<Delete>",lambda *_: self.del_button.invoke())
 
+            # binds Ctrl+Z and Ctrl+Y to Undo and Redo buttons
+            self.root.bind("<Control-z>",lambda *_: self.undo_btn.invoke())
+            self.root.bind("<Control-y>",lambda *_: self.redo_btn.invoke())
+
             # toggles if_toggled_entrybox
             self.if_toggled_entrybox = False
 
@@ -657,6 +818,10 @@ class MACEasyManager:
             # unbinds Delete to Delete button
             self.root.unbind("<Delete>")
 
+            # unbinds Ctrl+Z and Ctrl+Y from Undo and Redo buttons
+            self.root.unbind("<Control-z>")
+            self.root.unbind("<Control-y>")
+
             # binds Enter to save name in Change name entry
             self.change_name_entry.bind("<Return>",self.change_name)
 
@@ -682,12 +847,21 @@ class MACEasyManager:
 
     def back_to_profile(self):
         if self.check_if_saved():
-            # reinitalizes program
-            self.root.destroy()
-            self.__init__()
+            # hides main window, its widgets are reused for next profile
+            self.super_frame.pack_forget()
+            # unsaved changes were discarded
+            self.if_saved = True
+
+            # unbinds shortcuts of main window
+            for sequence in ("<Return>", "<Control-a>", "<Delete>", "<Control-z>", "<Control-y>"):
+                self.root.unbind(sequence)
+            self.root.unbind_all("<MouseWheel>")
+
+            self.show_profile_select()
     def close(self):
         if self.check_if_saved():
             # quits program
+            self.preview_executor.shutdown(wait=False,cancel_futures=True)
             self.root.destroy()
             self.root.quit()
     #endregion
@@ -715,246 +889,186 @@ class MACEasyManager:
         # has to check if sorting option is selected
         # because moving colors/icon up/down calls sort too
         if self.prim_sort.get() != "None":
-            # dictionary to map sorting options to functions
-            # 0 : name (case insensitive)
-            # 1 : color = turns color name into number, given by order in sorting order
-            # 2 : icon = turns icon name into number, given by order in sorting order
-            sort_func_dict = {
-                0 : lambda cont: cont["name"].lower(),
-                1 : lambda cont: self.current_order["color"].index(cont["color"]),
-                2 : lambda cont: self.current_order["icon"].index(cont["icon"])
-            }
-
             # gets 1st and 2nd sorting option from buttons
-            # 3rd sorting option from set difference
-            # (tuple to get value as int)
-            first_sort = int(self.prim_sort.get())
-            second_sort = int(self.sec_sort.get())
-            third_sort = tuple({0, 1, 2}.difference({first_sort, second_sort}))[0]
-
-            sort_options_lst = [first_sort, second_sort, third_sort]
-
-            # turns ints from sort_options_lst to functions in sort_func_dict
-            sort_func_lst = [sort_func_dict[option] for option in sort_options_lst]
-
-            # handles reverse sorting
-            # reverse sorting names has to be handled by built-in reverse keyword
-            # sets reverse to True if Reverse checkbutton for sorting name (0 in options list) is checked
             # checkbutton IntVar = 1 if selected, 0 if not
-            reverse = self.reverse_lst[sort_options_lst.index(0)].get()
-
-            for index, option in enumerate(sort_options_lst):
-                # if option is not sorting by name (0)
-                if option:
-                    # if button is unchecked (0) and reverse==True
-                    # (because reverse will be handled by reverse keyword in sort, so unchecked options have to be reversed to be sorted normally)
-                    # or button is checked (1) and reverse==False
-                    if self.reverse_lst[index].get() != reverse:
-                        # makes function return opposite number to sort number
-                        # so that it will sort in opposite direction
-                        sort_func_lst[index] = lambda cont, func=sort_func_lst[index]: -func(cont)
-
-            # performs sort with key being list of sorting indexes/names
-            self.ready_conts.sort(key=lambda cont: [func(cont) for func in sort_func_lst],reverse=reverse)
+            self.engine.sort(int(self.prim_sort.get()),int(self.sec_sort.get()),[var.get() for var in self.reverse_lst])
 
         # refreshes container treeview
         self.refresh_conts()
     #endregion
 
-    #region GET METHODS
-    def get_profiles(self):
-        # gets profiles.ini file from Firefox data folder
-        # C:\Users\{user}\AppData\Roaming\Mozilla\Firefox
-        # if file/folder doesn't exist, ConfigParser handles it internally
-        config = ConfigParser()
-        config.read(self.folder_path / "profiles.ini")
-
-        #region FILE STRUCTURE
-        # [Install208046BA024A39CB]
-        # Default=Profiles/asd213.default-release (< PATH TO DEFAULT PROFILE)
-        # Locked=1
-
-        # [Profile2]
-        # Name=something
-        # IsRelative=0
-        # Path=C:\Users\User\1231sad.something
-
-        # [Profile1]
-        # Name=default
-        # IsRelative=1
-        # Path=Profiles/12321asd.default
-        # Default=1 (! THIS DOES NOT CHANGE WITH DEFAULT PROFILE CHANGE)
-        #endregion
-        
-        # prevents unbound
-        default = None
-        # gets default profile from [Install] section
-        for section in config.sections():
-            if re.match("Install",section):
-                default = config[section]["Default"]
+    #region PROFILE SCAN METHODS
+    def start_profile_scan(self):
+        # stops previous scan and removes its radiobuttons
+        if self.profile_scan_after is not None:
+            self.root.after_cancel(self.profile_scan_after)
+        for widget in self.profile_radiobtn_frame.winfo_children():
+            widget.destroy()
+        self.prof_dict = {}
+        self.select_button.config(state="disabled")
+
+        self.profile_queue = queue.Queue()
+        Thread(target=self.scan_profiles,args=(self.folder_path,self.profile_queue,self.profiler),daemon=True).start()
+
+        self.profile_scan_after = self.root.after(PROFILE_SCAN_POLL,self.poll_profile_scan)
+
+    @staticmethod
+    def scan_profiles(folder_path,profile_queue,profiler):
+        # runs in background thread, doesn't touch any widgets
+        # passes found profiles to Tk thread through queue, None = end of scanning
+        try:
+            with profiler.timed("get_profiles"):
+                for profile in iter_profiles(folder_path):
+                    profile_queue.put(profile)
+        finally:
+            profile_queue.put(None)
+
+    def poll_profile_scan(self):
+        # adds all profiles found since last check
+        while True:
+            try:
+                profile = self.profile_queue.get_nowait()
+            except queue.Empty:
+                # checks again later
+                self.profile_scan_after = self.root.after(PROFILE_SCAN_POLL,self.poll_profile_scan)
+                return
+
+            if profile is None:
                 break
 
-        # gets all profiles names and paths from [ProfileN] sections
-        profile_dict = {}
+            self.add_profile_radiobtn(*profile)
 
-        for section in config.sections():
-            if re.match("Profile",section):
-                # gets path
-                path = config[section]["Path"]
-                # if path is relative, adds full folder path
-                full_path = self.folder_path / path if config[section]["isRelative"] else Path(path)
+        self.profile_scan_after = None
 
-                # checks if profile is not empty
-                if Path.exists(full_path / "containers.json"):
-                    name = config[section]["Name"]
-                    is_default = path==default
+        # previously selected profile is gone, selects 1st one
+        if self.prof_dict and self.profile_radiobtn_var.get() not in self.prof_dict:
+            self.profile_radiobtn_var.set(next(iter(self.prof_dict)))
+            self.get_def_language()
+            self.enable_select_button()
 
-                    # profile name is unique
-                    # creates profile_dict
-                    profile_dict[name] = {}
-                    profile_dict[name]["path"] = full_path
-                    profile_dict[name]["is_default"] = is_default   
+        # if no profiles found
+        if not self.prof_dict:
+            tk.Label(self.profile_radiobtn_frame,text=self.gui_vars["text"]["profile_select_window"]["no_profs"],font=self.gui_vars["font"]["normal"],fg=self.gui_vars["color"]["warn"]).pack()
 
-        self.prof_dict = profile_dict 
-    
-    def get_containers(self):
-        # loads whole containers.json file
-        with open(self.sel_prof_path / "containers.json",encoding="utf-8") as f:
-            self.raw_conts = json.load(f)
-
-        #region FILE STRUCTURE
-        # {
-        # "version": 4,
-        # "lastUserContextId": 6,
-        # "identities": [
-        #     {
-        #     "userContextId": 1,
-        #     "public": true,
-        #     "icon": "fingerprint",
-        #     "color": "blue",
-        #     "l10nID": "userContextPersonal.label",
-        #     "accessKey": "userContextPersonal.accesskey",
-        #     "telemetryId": 1
-        #     },
-        #     {
-        #     "userContextId": 2,
-        #     "public": true,
-        #     "icon": "briefcase",
-        #     "color": "orange",
-        #     "l10nID": "userContextWork.label",
-        #     "accessKey": "userContextWork.accesskey",
-        #     "telemetryId": 2
-        #     },
-        #     {
-        #     "userContextId": 3,
-        #     "public": true,
-        #     "icon": "dollar",
-        #     "color": "green",
-        #     "l10nID": "userContextBanking.label",
-        #     "accessKey": "userContextBanking.accesskey",
-        #     "telemetryId": 3
-        #     },
-        #     {
-        #     "userContextId": 4,
-        #     "public": true,
-        #     "icon": "cart",
-        #     "color": "pink",
-        #     "l10nID": "userContextShopping.label",
-        #     "accessKey": "userContextShopping.accesskey",
-        #     "telemetryId": 4
-        #     },
-        #     {
-        #     "userContextId": 5,
-        #     "public": false,
-        #     "icon": "",
-        #     "color": "",
-        #     "name": "userContextIdInternal.thumbnail",
-        #     "accessKey": ""
-        #     },
-        #     {
-        #     "userContextId": 4294967295,
-        #     "public": false,
-        #     "icon": "",
-        #     "color": "",
-        #     "name": "userContextIdInternal.webextStorageLocal",
-        #     "accessKey": ""
-        #     },
-        #     {
-        #     "userContextId": 6,
-        #     "public": true,
-        #     "icon": "dollar",
-        #     "color": "green",
-        #     "name": "Custom"
-        #     }
-        # ]
-        # }
-        #endregion
+    def add_profile_radiobtn(self,name,profile):
+        self.prof_dict[name] = profile
 
-        # gets ignored name/regex pattern
-        # ignored name = {input} followed by any number of digits
-        # if regex chosen, doesn't add default pattern
-        added_regex = "" if self.if_regex else r"(\d+|$)"
-        # if ignore case, adds re.I flag
-        pattern_str = self.ignored_str + added_regex
-        pattern = re.compile(pattern_str,re.I) if self.if_ignore_case.get() else re.compile(pattern_str)
-
-        self.ready_conts = []
-        self.ignored_conts = []
-
-        for identity in self.raw_conts["identities"]:
-            # ignores non-public identities
-            if identity["public"]:
-                # adds name to default containers with only AccessKey
-                # userContextPersonal.accessKey, userContextBanking.accessKey etc.
-                if "accessKey" in identity:
-                    # translates them to selected language
-                    lang = self.language_select_var.get()
-                    cont = re.search(r"userContext(.*)?.accesskey",identity["accessKey"]).group(1)
-
-                    identity["name"] = self.translation_data["by_name"][lang][cont]
-                
-                # puts ignored names into ignored_conts list
-                if self.if_ignored.get() and re.fullmatch(pattern,identity["name"]):
-                    self.ignored_conts.append(identity)
-                else:
-                    # else appends to main list ready_conts
-                    self.ready_conts.append(identity)
-            else:
-                # if identity is not public, appends to ignored_conts
-                self.ignored_conts.append(identity)
+        cur_btn = tk.Radiobutton(self.profile_radiobtn_frame,variable=self.profile_radiobtn_var,value=name,text=name,font=self.gui_vars["font"]["normal"],command=self.choose_profile)
 
-        # creates a deepcopy to compare to ready_cont to check if saved
-        self.orig_conts = deepcopy(self.ready_conts)
+        # if profile is default, makes text bold
+        if profile["is_default"]:
+            cur_btn.config(font=self.gui_vars["font"]["default_profile"])
+
+        cur_btn.pack()
+
+        # selects 1st found profile (in case default profile is empty)
+        # and then default profile, unless user already chose another one
+        if not self.profile_radiobtn_var.get() or (profile["is_default"] and not self.if_profile_chosen):
+            self.profile_radiobtn_var.set(name)
+            self.get_def_language()
+
+        # enables Select button when selected profile is found
+        if self.profile_radiobtn_var.get() == name:
+            self.enable_select_button()
+            self.schedule_ignore_preview()
+
+    def enable_select_button(self):
+        self.select_button.config(state="normal")
+        self.select_button.focus()
+        # binds Enter to button action
+        self.root.bind("<Return>",lambda *_: self.select_button.invoke())
+
+    def choose_profile(self):
+        self.if_profile_chosen = True
+        self.get_def_language()
+    #endregion
+
+    #region GET METHODS
+    def get_containers(self):
+        self.engine.load(self.sel_prof_path,self.language_select_var.get(),self.ignored_str,self.if_ignored.get(),self.if_regex.get(),self.if_ignore_case.get())
 
-        # gets last ID
-        self.last_id = self.raw_conts["lastUserContextId"]
-    
     def get_def_language(self):
         # if any profile exists
         # otherwise default to en-US
         main_lang = "en-US"
         if self.profile_radiobtn_var.get():
-            # get Firefox's language for selected profile
-            # in user.js (may not exist) or prefs.js
-            # user_pref("intl.locale.requested", "en-US,ast")
-            cur_prof_path = self.prof_dict[self.profile_radiobtn_var.get()]["path"]
+            with self.profiler.timed("get_def_language"):
+                main_lang = get_def_language(self.prof_dict[self.profile_radiobtn_var.get()]["path"])
+
+        self.language_select_var.set(self.translations.by_code[main_lang])
+    #endregion
+    
+    #region IGNORE PREVIEW METHODS
+    def schedule_ignore_preview(self,*_):
+        # waits until options stop changing (e.g. user stops typing)
+        if self.ignore_preview_after is not None:
+            self.root.after_cancel(self.ignore_preview_after)
+
+        self.ignore_preview_after = self.root.after(IGNORE_PREVIEW_DELAY,self.start_ignore_preview)
 
-            user_path = cur_prof_path / "user.js"
+    def start_ignore_preview(self):
+        self.ignore_preview_after = None
 
-            pref_path = user_path if user_path.exists() else cur_prof_path / "prefs.js"
+        # (selected profile may not be found yet when rescanning)
+        profile = self.profile_radiobtn_var.get()
+        if profile not in self.prof_dict:
+            return
 
-            lang_pref_pattern = re.compile(r'user_pref\("intl\.locale\.requested", "(.*?)"\)')
+        # translations of default containers' names in selected language
+        language = self.language_select_var.get()
+        translations = self.translations[language] if language in self.translations else {}
+        # if ignoring is off, nothing is ignored
+        ignored_str = self.ignore_entrybox.get() if self.if_ignored.get() else ""
 
-            with open(pref_path,encoding="utf-8") as f:
-                lang_settings = re.search(lang_pref_pattern,f.read())
-                # the setting may not exist if there's only 1 language
-                if lang_settings is not None:
-                    all_langs = lang_settings.group(1)
-                    main_lang = all_langs.split(",")[0]
+        # previous preview isn't needed anymore if it hasn't started yet
+        if self.ignore_preview_future is not None:
+            self.ignore_preview_future.cancel()
 
-        self.language_select_var.set(self.translation_data["by_code"][main_lang])
+        self.ignore_preview_future = self.preview_executor.submit(preview_ignored,self.prof_dict[profile]["path"],translations,ignored_str,self.if_regex.get(),self.if_ignore_case.get())
+
+        self.ignore_preview_label.config(text=self.gui_vars["text"]["profile_select_window"]["ignore_preview_loading"],fg=self.gui_vars["color"]["small_text"])
+        self.ignore_preview_after = self.root.after(IGNORE_PREVIEW_POLL,self.poll_ignore_preview)
+
+    def poll_ignore_preview(self):
+        self.ignore_preview_after = None
+        future = self.ignore_preview_future
+
+        # checks again later if not ready
+        if not future.done():
+            self.ignore_preview_after = self.root.after(IGNORE_PREVIEW_POLL,self.poll_ignore_preview)
+            return
+
+        texts = self.gui_vars["text"]["profile_select_window"]
+        # preview is only a hint, so unexpected errors are shown in label too
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {"error": str(e)}
+
+        if result["error"] is not None:
+            self.ignore_preview_label.config(text=texts["ignore_preview_error"].format(error=result["error"]),fg=self.gui_vars["color"]["warn"])
+            return
+
+        # shows first few names of each, with "..." if there are more
+        samples = {}
+        for kind in ("ignored", "kept"):
+            sample = ", ".join(result[f"{kind}_sample"])
+            if result[kind] > len(result[f"{kind}_sample"]):
+                sample += ", ..."
+            samples[f"{kind}_sample"] = sample
+
+        self.ignore_preview_label.config(text=texts["ignore_preview"].format(ignored=result["ignored"],kept=result["kept"],**samples),fg=self.gui_vars["color"]["small_text"])
+
+    def cancel_ignore_preview(self):
+        if self.ignore_preview_after is not None:
+            self.root.after_cancel(self.ignore_preview_after)
+            self.ignore_preview_after = None
+
+        if self.ignore_preview_future is not None:
+            self.ignore_preview_future.cancel()
+            self.ignore_preview_future = None
     #endregion
-    
+
     #region REFRESH METHODS
     def refresh_conts(self,if_deleted=None):
         selections = self.cont_treeview.selection()
@@ -971,16 +1085,12 @@ class MACEasyManager:
             # gets next item after last one selected (if it's not last)
             # to select if selected items are deleted
             if max_index != len(orig_items)-1:
-                next_item = (self.cont_treeview.get_children()[max_index+1],)
-            # else next_item is set to last item in new treeview after repopulating
-                
-        # clears treeview
-        self.cont_treeview.delete(*self.cont_treeview.get_children())
+                next_item = (orig_items[max_index+1],)
+            # else next_item is set to last item in new treeview after updating
 
-        # repopulates treeview
-        # args = parent ("" = new toplevel entry), index, id (= userContextId)
-        for container in self.ready_conts:
-            self.cont_treeview.insert("","end",container["userContextId"],text=container["name"],image=self.icon_imgs[container["color"]+container["icon"]])
+        # updates treeview, only visible rows are redrawn
+        # id = userContextId
+        self.cont_treeview.set_items([(container["userContextId"], container["name"], container["color"]+container["icon"]) for container in self.engine.ready_conts])
 
         # checks if items were added/deleted
         new_items = self.cont_treeview.get_children()
@@ -991,7 +1101,11 @@ class MACEasyManager:
         # then it needs to ignore if_added
         # (which is triggered if containers were deleted)
         # changes if_saved boole if current items are different from original original
-        self.if_saved = self.ready_conts==self.orig_conts
+        self.if_saved = self.engine.is_saved()
+
+        # enables Undo/Redo buttons if there is anything to undo/redo
+        self.undo_btn.config(state="normal" if self.engine.history.can_undo() else "disabled")
+        self.redo_btn.config(state="normal" if self.engine.history.can_redo() else "disabled")
 
         # disables Current container and Delete if empty
         if len(new_items) == 0:
@@ -1014,12 +1128,10 @@ class MACEasyManager:
             self.del_button.config(state="disabled")
         # if not empty, if there is selection (deleting also requires selection) or new container was added, restores selection
         elif selections or if_added:
-            # gets original IDs as a tuple to compare to selection
-            orig_conts_items = tuple(str(cont["userContextId"]) for cont in self.orig_conts)
             # if original containers were restored, only select those previously selected that are in orig conts
             # ignore added conts
-            if new_items==orig_conts_items and not if_deleted:
-                selections = tuple(selection for selection in selections if selection in orig_conts_items)
+            if self.engine.tracker.is_order_restored() and not if_deleted:
+                selections = tuple(selection for selection in selections if int(selection) in self.engine.tracker.orig_positions)
 
             elif if_added and not self.if_saved:
                 # gets added container's ID from difference of current items and orig_items
@@ -1031,7 +1143,7 @@ class MACEasyManager:
             elif if_deleted:
                 # set next_item to last item if it's None
                 if next_item is None:
-                    next_item = (self.cont_treeview.get_children()[-1],)
+                    next_item = (new_items[-1],)
 
                 selections = next_item
 
@@ -1046,13 +1158,9 @@ class MACEasyManager:
     def refresh_colors(self):
         selections = self.color_treeview.selection()
 
-        # clears treeview
-        self.color_treeview.delete(*self.color_treeview.get_children())
-
-        # repopulates treeview
-        # args = parent ("" = new toplevel entry), index, id (= color)
-        for color in self.current_order["color"]:
-            self.color_treeview.insert("","end",color,text=color,image=self.icon_imgs[color+"circle"])
+        # updates treeview with only the changed rows
+        # id = color
+        self.color_tree_sync.update([(color, color, color+"circle") for color in self.engine.current_order["color"]])
 
         # restores selection
         # checks if there is selection to not trigger color_handle_select
@@ -1062,13 +1170,9 @@ class MACEasyManager:
     def refresh_icons(self):
         selections = self.icon_treeview.selection()
 
-        # clears treeview
-        self.icon_treeview.delete(*self.icon_treeview.get_children())
-
-        # repopulates treeview
-        # args = parent ("" = new toplevel entry), index, id (= icon)
-        for icon in self.current_order["icon"]:
-            self.icon_treeview.insert("","end",icon,text=icon,image=self.icon_imgs["toolbar"+icon])
+        # updates treeview with only the changed rows
+        # id = icon
+        self.icon_tree_sync.update([(icon, icon, "toolbar"+icon) for icon in self.engine.current_order["icon"]])
     
         # restore selection
         # checks if there is selection to not trigger icon_handle_select
@@ -1086,20 +1190,18 @@ class MACEasyManager:
         # handles start case when there is no selection
         if selections:
             # gets indexes to check if selection can be moved up and down
-            indices = [self.cont_treeview.index(selection) for selection in selections]
-            
+            indices = [self.engine.get_position(selection) for selection in selections]
+
             # if 1 item is selected
             if len(selections) == 1:
-                # finds container of given ID in ready_conts
-                for container in self.ready_conts:
-                    if container["userContextId"] == int(selections[0]):
-                        # modifies Current container's name and icon
-                        cont_name = container["name"]
-                        self.cur_cont_name.config(text=cont_name)
-                        self.cur_cont_icon.config(image=self.icon_imgs[container["color"]+container["icon"]])
-                        # font color = black
-                        fg = "black"
-                        break
+                # finds container of given ID
+                container = self.engine.get_container(selections[0])
+                # modifies Current container's name and icon
+                cont_name = container["name"]
+                self.cur_cont_name.config(text=cont_name)
+                self.cur_cont_icon.config(image=self.icon_imgs[container["color"]+container["icon"]])
+                # font color = black
+                fg = "black"
             # if multiple items are selected
             else:
                 # checks if all selected items have same name/color/icon
@@ -1107,12 +1209,11 @@ class MACEasyManager:
                 name_set = set()
                 color_set = set()
                 icon_set = set()
-                for item_id in selections:
-                    for container in self.ready_conts:
-                        if container["userContextId"] == int(item_id):
-                            name_set.add(container["name"])
-                            color_set.add(container["color"])
-                            icon_set.add(container["icon"])
+                for item_id in set(selections):
+                    container = self.engine.get_container(item_id)
+                    name_set.add(container["name"])
+                    color_set.add(container["color"])
+                    icon_set.add(container["icon"])
 
                 # if all selected items have same name, show that name
                 if len(name_set) == 1:
@@ -1160,17 +1261,28 @@ class MACEasyManager:
             # compares minimal index to 0
             if min(indices)==0:
                 self.cont_move_up_btn.config(state="disabled")
+                self.cont_move_top_btn.config(state="disabled")
             else:
                 self.cont_move_up_btn.config(state="normal")
+                self.cont_move_top_btn.config(state="normal")
             
             # compares maximal index to length of treeview
-            if max(indices)==len(self.cont_treeview.get_children())-1:
+            if max(indices)==len(self.engine.ready_conts)-1:
                 self.cont_move_down_btn.config(state="disabled")
+                self.cont_move_bottom_btn.config(state="disabled")
             else:
                 self.cont_move_down_btn.config(state="normal")
+                self.cont_move_bottom_btn.config(state="normal")
         
     def color_handle_select(self,*_):
         selections = self.color_treeview.selection()
+
+        # selection was removed, nothing to move
+        if not selections:
+            self.color_move_up_btn.config(state="disabled")
+            self.color_move_down_btn.config(state="disabled")
+            return
+
         # gets indexes to check if selection can be moved up and down
         indices = [self.color_treeview.index(selection) for selection in selections]
 
@@ -1189,6 +1301,13 @@ class MACEasyManager:
     
     def icon_handle_select(self,_):
         selections = self.icon_treeview.selection()
+
+        # selection was removed, nothing to move
+        if not selections:
+            self.icon_move_up_btn.config(state="disabled")
+            self.icon_move_down_btn.config(state="disabled")
+            return
+
         # gets indexes to check if selection can be moved up and down
         indices = [self.icon_treeview.index(selection) for selection in selections]
 
@@ -1212,12 +1331,7 @@ class MACEasyManager:
 
     #region MOVE UP & DOWN METHODS
     def cont_move_up(self):
-        selections = self.cont_treeview.selection()
-
-        # finds selected container and exchanges it with container below
-        for ind, container in enumerate(self.ready_conts):
-            if str(container["userContextId"]) in selections:
-                self.ready_conts[ind], self.ready_conts[ind-1] = self.ready_conts[ind-1], self.ready_conts[ind]
+        self.engine.cont_move_up(self.cont_treeview.selection())
 
         # refreshes treeview
         self.refresh_conts()
@@ -1229,14 +1343,7 @@ class MACEasyManager:
         for btn in self.sec_sort_lst:
             btn.config(state="disabled")
     def cont_move_down(self):
-        selections = self.cont_treeview.selection()
-
-        # finds selected container and exchanges it with container below
-        # has to go through list in reverse
-        for container in self.ready_conts[::-1]:
-            if str(container["userContextId"]) in selections:
-                ind = self.ready_conts.index(container)
-                self.ready_conts[ind], self.ready_conts[ind+1] = self.ready_conts[ind+1], self.ready_conts[ind]
+        self.engine.cont_move_down(self.cont_treeview.selection())
 
         self.refresh_conts()
 
@@ -1245,70 +1352,112 @@ class MACEasyManager:
         self.sec_sort.set(None)
         for btn in self.sec_sort_lst:
             btn.config(state="disabled")
-        selection_item = self.cont_treeview.selection()
-        selection_id = int(selection_item[0])
 
-    def color_move_up(self):
-        selections = self.color_treeview.selection()
+    def cont_move_top(self):
+        self.cont_move_to(0)
+    def cont_move_bottom(self):
+        self.cont_move_to(len(self.engine.ready_conts))
+    def cont_move_to(self,index):
+        # moves whole selection at once
+        # index = number of not selected containers above selection after moving
+        self.engine.cont_move_to(self.cont_treeview.selection(),index)
+
+        # refreshes treeview once
+        # (also scrolls to moved containers)
+        self.refresh_conts()
+
+        # deselects sorting radiobuttons
+        self.prim_sort.set(None)
+        self.sec_sort.set(None)
+        for btn in self.sec_sort_lst:
+            btn.config(state="disabled")
+
+    #region DRAG & DROP
+    def cont_drag_start(self,event):
+        # remembers item where dragging started
+        self.cont_drag_item = self.cont_treeview.identify_row(event.y) or None
+    def cont_drag_motion(self,event):
+        if self.cont_drag_item is not None:
+            # shows that items are being dragged
+            self.cont_treeview.config(cursor="sb_v_double_arrow")
+    def cont_drag_drop(self,event):
+        self.cont_treeview.config(cursor="")
+
+        start_item = self.cont_drag_item
+        self.cont_drag_item = None
+
+        target_item = self.cont_treeview.identify_row(event.y)
+        selections = self.cont_treeview.selection()
+
+        # does nothing if it was just a click or if dropped on selected container
+        if start_item is None or not target_item or target_item == start_item or target_item in selections:
+            return
+
+        # index of target among not selected containers
+        target_pos = self.engine.get_position(target_item)
+        index = target_pos - sum(1 for selection in selections if self.engine.get_position(selection) < target_pos)
+
+        # dragging down drops selection below target, dragging up drops it above
+        if self.engine.get_position(start_item) < target_pos:
+            index += 1
 
-        # finds selected color and exchanges it with color below
-        for ind, color in enumerate(self.current_order["color"]):
-            if color in selections:
-                self.current_order["color"][ind], self.current_order["color"][ind-1] = self.current_order["color"][ind-1], self.current_order["color"][ind]
+        self.cont_move_to(index)
+    #endregion
+
+    def color_move_up(self):
+        self.engine.order_move_up("color",self.color_treeview.selection())
 
         # refreshes color treeview and sorts
         self.refresh_colors()
         self.sort()
     def color_move_down(self):
-        selections = self.color_treeview.selection()
-
-        # finds selected color and exchanges it with color below
-        # has to go through list in reverse
-        for color in self.current_order["color"][::-1]:
-            if color in selections:
-                ind = self.current_order["color"].index(color)
-                self.current_order["color"][ind], self.current_order["color"][ind+1] = self.current_order["color"][ind+1], self.current_order["color"][ind]
+        self.engine.order_move_down("color",self.color_treeview.selection())
 
         # refreshes color treeview and sorts
         self.refresh_colors()
         self.sort()
 
     def icon_move_up(self):
-        selections = self.icon_treeview.selection()
-
-        # finds selected icon and exchanges it with icon below
-        for ind, icon in enumerate(self.current_order["icon"]):
-            if icon in selections:
-                self.current_order["icon"][ind], self.current_order["icon"][ind-1] = self.current_order["icon"][ind-1], self.current_order["icon"][ind]
+        self.engine.order_move_up("icon",self.icon_treeview.selection())
 
         # refreshes icon treeview and sorts
         self.refresh_icons()
         self.sort()
     def icon_move_down(self):
-        selections = self.icon_treeview.selection()
-
-        # finds selected icon and exchanges it with icon below
-        # has to go through list in reverse
-        for icon in self.current_order["icon"][::-1]:
-            if icon in selections:
-                ind = self.current_order["icon"].index(icon)
-                self.current_order["icon"][ind], self.current_order["icon"][ind+1] = self.current_order["icon"][ind+1], self.current_order["icon"][ind]
-
-                # refreshes color treeview and sorts
-
-                # refreshes color treeview and sorts
-
-                # refreshes color treeview and sorts
+        self.engine.order_move_down("icon",self.icon_treeview.selection())
 
         # refreshes icon treeview and sorts
         self.refresh_icons()
         self.sort()
     #endregion
 
+    #region UNDO & REDO METHODS
+    def cont_undo(self):
+        if self.engine.undo():
+            self.refresh_conts()
+
+            # deselects sorting radiobuttons
+            self.prim_sort.set(None)
+            self.sec_sort.set(None)
+            # disables Secondary radiobuttons
+            for btn in self.sec_sort_lst:
+                btn.config(state="disabled")
+    def cont_redo(self):
+        if self.engine.redo():
+            self.refresh_conts()
+
+            # deselects sorting radiobuttons
+            self.prim_sort.set(None)
+            self.sec_sort.set(None)
+            # disables Secondary radiobuttons
+            for btn in self.sec_sort_lst:
+                btn.config(state="disabled")
+    #endregion
+
     #region RESET ORIGINAL ORDER METHODS
     def color_reset(self):
-        # makes current order a deepcopy of original order
-        self.current_order["color"] = deepcopy(self.orig_order["color"])
+        # makes current order a copy of original order
+        self.engine.order_reset("color")
 
         # refreshes color treeview
         self.sort()
@@ -1320,8 +1469,8 @@ class MACEasyManager:
         self.color_saved_label.after(self.gui_vars["timer"],lambda: self.color_saved_label.config(text=""))
     
     def icon_reset(self):
-        # makes current order a deepcopy of original order
-        self.current_order["icon"] = deepcopy(self.orig_order["icon"])
+        # makes current order a copy of original order
+        self.engine.order_reset("icon")
 
         # refreshes icon treeview
         self.sort()
@@ -1334,11 +1483,8 @@ class MACEasyManager:
     #endregion
     #region RESTORE DEFAULT ORDER METHODS
     def cont_restore(self):
-        # check if new containers have been added/containers have been edited by simulated set difference
-        # (sets can't be used because dictionaries are not hashable)
-        changed_conts = [cont for cont in self.ready_conts if cont not in self.orig_conts]
-        # gets deleted containers too
-        deleted_conts = [cont for cont in self.orig_conts if cont not in self.ready_conts]
+        # check if new containers have been added/edited/deleted
+        changed_conts, deleted_conts = self.engine.get_changes()
 
         # if added/changed/deleted, show a warning message
         if changed_conts or deleted_conts:
@@ -1347,7 +1493,7 @@ class MACEasyManager:
             if not messagebox.askyesno(title=self.gui_vars["text"]["added_warning"]["title"],message=self.gui_vars["text"]["added_warning"]["message"]):
                 return
 
-        self.get_containers()
+        self.engine.get_containers()
         self.refresh_conts()
 
         # show Restored! label
@@ -1363,12 +1509,18 @@ class MACEasyManager:
             btn.config(state="disabled")
 
     def sort_opts_restore(self):
-        if not Path("sorting_options.json").exists():
+        name = self.sort_preset_var.get()
+        if name not in self.sort_presets:
             return messagebox.showwarning(**self.gui_vars["text"]["no_sort_options"])
 
-        with open("sorting_options.json") as f:
-            opts = json.load(f)
+        self.apply_sorting_options(self.sort_presets[name])
 
+        # shows Loaded! label
+        self.sort_saved_label.config(text=self.gui_vars["text"]["main_window"]["loaded"])
+        # after 1 second, removes text
+        self.sort_saved_label.after(self.gui_vars["timer"],lambda: self.sort_saved_label.config(text=""))
+
+    def apply_sorting_options(self,opts):
         prim, prim_rev = opts["primary"]
         self.prim_sort.set(prim)
         self.reverse_lst[0].set(prim_rev)
@@ -1379,16 +1531,17 @@ class MACEasyManager:
 
         self.reverse_lst[2].set(opts["tertiary"])
 
-        self.sort()
+        # enables Secondary buttons like choosing Primary does
+        if prim != "None":
+            for btn in self.sec_sort_lst:
+                btn.config(state="normal")
+            self.sec_sort_lst[int(prim)].config(state="disabled")
 
-        # shows Restored! label
-        self.sort_saved_label.config(text=self.gui_vars["text"]["main_window"]["loaded"])
-        # after 1 second, removes text
-        self.sort_saved_label.after(self.gui_vars["timer"],lambda: self.sort_saved_label.config(text=""))
+        self.sort()
 
     def color_restore(self):
-        # makes current order a deepcopy of default order
-        self.current_order["color"] = deepcopy(self.default_order["color"])
+        # makes current order a copy of default order
+        self.engine.order_restore("color")
 
         # refreshes color treeview
         self.refresh_colors()
@@ -1400,8 +1553,8 @@ class MACEasyManager:
         self.color_saved_label.after(self.gui_vars["timer"],lambda: self.color_saved_label.config(text=""))
 
     def icon_restore(self):
-        # makes current order a deepcopy of default order
-        self.current_order["icon"] = deepcopy(self.default_order["icon"])
+        # makes current order a copy of default order
+        self.engine.order_restore("icon")
 
         # refreshes icon treeview
         self.refresh_icons()
@@ -1426,21 +1579,53 @@ class MACEasyManager:
             "tertiary" : self.reverse_lst[2].get()
         }
 
-        with open("sorting_options.json","w",encoding="utf-8") as f:
-            json.dump(opts,f)
+        # saves under chosen name (default one if empty)
+        name = self.sort_preset_var.get().strip() or DEFAULT_PRESET
+        self.sort_preset_var.set(name)
+
+        self.sort_presets.save_preset(name,opts)
+        self.sort_preset_select.config(values=self.sort_presets.names())
     
         # shows Saved! label
         self.sort_saved_label.config(text=self.gui_vars["text"]["main_window"]["saved"])
         # after 1 second, removes text
         self.sort_saved_label.after(self.gui_vars["timer"],lambda: self.sort_saved_label.config(text=""))
 
-    def color_save_order(self):
-        # deepcopies current order to default order
-        self.default_order["color"] = deepcopy(self.current_order["color"])
+    def delete_sorting_options(self):
+        name = self.sort_preset_var.get()
+        if name not in self.sort_presets:
+            return messagebox.showwarning(**self.gui_vars["text"]["no_sort_options"])
+
+        # also unbinds it from all profiles
+        self.sort_presets.delete_preset(name)
+        self.sort_preset_select.config(values=self.sort_presets.names())
+        self.if_preset_bound.set(0)
+
+        # shows Deleted! label
+        self.sort_saved_label.config(text=self.gui_vars["text"]["main_window"]["deleted"])
+        # after 1 second, removes text
+        self.sort_saved_label.after(self.gui_vars["timer"],lambda: self.sort_saved_label.config(text=""))
+
+    def bind_sorting_options(self):
+        if not self.if_preset_bound.get():
+            self.sort_presets.bind(self.sel_prof_path,None)
+            return
+
+        # only saved preset can be bound
+        name = self.sort_preset_var.get()
+        if name not in self.sort_presets:
+            self.if_preset_bound.set(0)
+            return messagebox.showwarning(**self.gui_vars["text"]["no_sort_options"])
+
+        self.sort_presets.bind(self.sel_prof_path,name)
 
-        # saves default order to config file
-        with open('default_order.json','w',encoding="utf-8") as f:
-            json.dump(self.default_order,f)
+    def sort_preset_handle_select(self,*_):
+        # checkbutton is checked only if chosen preset is bound to profile
+        self.if_preset_bound.set(int(self.sort_presets.get_binding(self.sel_prof_path) == self.sort_preset_var.get()))
+
+    def color_save_order(self):
+        # copies current order to default order and saves it to config file
+        self.engine.order_save("color")
         
         # shows Saved! label
         self.color_saved_label.config(text=self.gui_vars["text"]["main_window"]["saved"])
@@ -1448,12 +1633,8 @@ class MACEasyManager:
         self.color_saved_label.after(self.gui_vars["timer"],lambda: self.color_saved_label.config(text=""))
 
     def icon_save_order(self):
-        # deepcopies current order to default order
-        self.default_order["icon"] = deepcopy(self.current_order["icon"])
-
-        # saves default order to config file
-        with open('default_order.json','w',encoding="utf-8") as f:
-            json.dump(self.default_order,f)
+        # copies current order to default order and saves it to config file
+        self.engine.order_save("icon")
 
         # shows Saved! label
         self.icon_saved_label.config(text=self.gui_vars["text"]["main_window"]["saved"])
@@ -1463,45 +1644,21 @@ class MACEasyManager:
 
     #region EDIT CONTAINER METHODS
     def change_name(self,*_):
-        selections = self.cont_treeview.selection()
         # gets name from Change name entrybox
-        name = self.change_name_entry.get()
-
-        for container in self.ready_conts:
-            if str(container["userContextId"]) in selections:
-                # if container is default, removes "l10nID" and "accessKey" keys
-                if "accessKey" in container:
-                    del container["accessKey"]
-                    del container["l10nID"]
-                container["name"] = name
-        
+        self.engine.change_name(self.cont_treeview.selection(),self.change_name_entry.get())
+
         self.sort()
     def change_color(self,color):
-        selections = self.cont_treeview.selection()
-        
-        for container in self.ready_conts:
-            if str(container["userContextId"]) in selections:
-                container["color"] = color
-        
+        self.engine.change_color(self.cont_treeview.selection(),color)
+
         self.sort()
     def change_icon(self,icon):
-        selections = self.cont_treeview.selection()
-        
-        for container in self.ready_conts:
-            if str(container["userContextId"]) in selections:
-                container["icon"] = icon
+        self.engine.change_icon(self.cont_treeview.selection(),icon)
 
         self.sort()
-    
-    def delete_cont(self):
-        selections = self.cont_treeview.selection()
 
-        # temp_lst to avoid iterating over list and deleting its items
-        temp_lst = deepcopy(self.ready_conts)
-
-        for container in temp_lst:
-            if str(container["userContextId"]) in selections:
-                self.ready_conts.remove(container)
+    def delete_cont(self):
+        self.engine.delete_cont(self.cont_treeview.selection())
 
         # doesn't need to sort, order same
         self.refresh_conts(if_deleted=True)
@@ -1547,7 +1704,7 @@ class MACEasyManager:
         # buttons
         self.add_color_lst = []
 
-        for index, color in enumerate(self.orig_order["color"]):
+        for index, color in enumerate(self.engine.orig_order["color"]):
             # command gets index to modify button
             self.add_color_lst.append(tk.Button(self.add_color_frame,image=self.icon_imgs[color+"circle"],borderwidth=0,command=lambda i=index, j=color: self.add_color_update(i,j)))
 
@@ -1564,7 +1721,7 @@ class MACEasyManager:
         # buttons
         self.add_icon_lst = []
 
-        for index, icon in enumerate(self.orig_order["icon"]):
+        for index, icon in enumerate(self.engine.orig_order["icon"]):
             # command gets index to modify button
             self.add_icon_lst.append(tk.Button(self.add_icon_frame,image=self.icon_imgs["toolbar"+icon],borderwidth=0,command=lambda i=index, j=icon : self.add_icon_update(i,j)))
 
@@ -1645,16 +1802,7 @@ class MACEasyManager:
             self.add_add_button.config(state="disabled")
             
     def add_cont_save(self):
-        self.last_id += 1
-
-        temp_con = {}
-        temp_con["userContextId"] = self.last_id
-        temp_con["public"] = True
-        temp_con["icon"] = self.add_icon
-        temp_con["color"] = self.add_color
-        temp_con["name"] = self.add_name_entry.get()
-
-        self.ready_conts.append(deepcopy(temp_con))
+        self.engine.add_cont(self.add_name_entry.get(),self.add_color,self.add_icon)
         self.sort()
 
         self.add_popup.destroy()
@@ -1669,36 +1817,8 @@ class MACEasyManager:
             return messagebox.askyesno(**self.gui_vars["text"]["save_warning"])
 
     def save(self):
-        ready_output = deepcopy(self.ready_conts)
-
-        # removes "name" property if "accessKey" is present
-        for container in ready_output:
-            if "accessKey" in container:
-                del container["name"]
-
-        # appends ignored containers to ready containers
-        identities_output = ready_output + self.ignored_conts
-
-        # gets entire raw file
-        output = deepcopy(self.raw_conts)
-        # updates containers
-        output["identities"] = deepcopy(identities_output)
-        # updates lastUserContextId
-        output["lastUserContextId"] = self.last_id
-
-        # creates backup with name:
-        # {profile}_{DD-MM-YY_HH-MM-SS}.json
-        backup_filename = f'{self.profile_radiobtn_var.get()}_{datetime.now().strftime("%d-%m-%Y_%H-%M-%S")}.json'
-
-        backup_path = Path("backups")
-        if not backup_path.exists():
-            backup_path.mkdir()
-
-        shutil.copy(self.sel_prof_path / "containers.json", backup_path / backup_filename)
-
-        # saves file
-        with open(self.sel_prof_path / "containers.json","w",encoding="utf-8") as f:
-            json.dump(output,f)
+        # backup is named after selected profile
+        self.engine.save(self.sel_prof_name)
 
         # shows Success message
         messagebox.showinfo(**self.gui_vars["text"]["save_success"])
@@ -0,0 +1,103 @@
+from container_io import write_json_atomic
+import json
+import os
+from pathlib import Path
+
+# preset selected at start, also name given to single preset from older files
+DEFAULT_PRESET = "default"
+
+#region FILE STRUCTURE
+# sorting_options.json
+# {
+# "presets": {
+#     "default": {"primary": ["0", 0], "secondary": ["1", 0], "tertiary": 0},
+#     ...
+# },
+# "profiles": {"C:\\Users\\User\\AppData\\Roaming\\Mozilla\\Firefox\\Profiles\\asd213.default-release": "default", ...}
+# }
+# primary/secondary = [sorting option ("0" = name, "1" = color, "2" = icon, "None" = not sorted), reverse (0/1)]
+# tertiary = reverse (0/1)
+# profiles = presets applied automatically when profile is opened
+# older files hold only one preset ({"primary": ..., "secondary": ..., "tertiary": ...})
+#endregion
+
+def preset_to_spec(opts):
+    # returns (primary, secondary, reverse_lst) like ContainerEngine.sort takes
+    # or None if preset doesn't sort
+    prim, prim_rev = opts["primary"]
+    sec, sec_rev = opts["secondary"]
+
+    if prim == "None":
+        return None
+
+    return int(prim), int(sec), [prim_rev, sec_rev, opts["tertiary"]]
+
+class SortPresets:
+    # named sorting options with optional binding to Firefox profiles
+    # file is read once, then presets are kept in memory and file is only written on changes
+    def __init__(self,path=Path("sorting_options.json")):
+        self.path = Path(path)
+
+        # {name: {"primary": ..., "secondary": ..., "tertiary": ...}}
+        self.presets = {}
+        # {profile key: name of preset}
+        self.profiles = {}
+
+        if self.path.exists():
+            with open(self.path,encoding="utf-8") as f:
+                data = json.load(f)
+
+            if "primary" in data:
+                self.presets[DEFAULT_PRESET] = data
+            else:
+                self.presets = data.get("presets",{})
+                self.profiles = data.get("profiles",{})
+
+    def write(self):
+        write_json_atomic(self.path,{"presets": self.presets, "profiles": self.profiles})
+
+    #region PRESETS
+    def names(self):
+        return sorted(self.presets,key=str.lower)
+
+    def __contains__(self,name):
+        return name in self.presets
+
+    def __getitem__(self,name):
+        return self.presets[name]
+
+    def save_preset(self,name,opts):
+        self.presets[name] = opts
+        self.write()
+
+    def delete_preset(self,name):
+        del self.presets[name]
+        # profiles using it aren't sorted automatically anymore
+        self.profiles = {key: preset for key, preset in self.profiles.items() if preset != name}
+        self.write()
+    #endregion
+
+    #region PROFILE BINDING
+    @staticmethod
+    def profile_key(prof_path):
+        # same folder can be given as different paths (relative, different case on Windows)
+        # (doesn't touch disk, profiles may be on slow network drives)
+        return os.path.normcase(os.path.abspath(prof_path))
+
+    def get_binding(self,prof_path):
+        # name of preset applied when profile is opened, or None
+        # (file could've been edited by hand, so preset may be missing)
+        name = self.profiles.get(self.profile_key(prof_path))
+        return name if name in self.presets else None
+
+    def bind(self,prof_path,name):
+        # name = None removes binding
+        key = self.profile_key(prof_path)
+
+        if name is None:
+            self.profiles.pop(key,None)
+        else:
+            self.profiles[key] = name
+
+        self.write()
+    #endregion
@@ -0,0 +1,166 @@
+import builtins
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+import json
+from pathlib import Path
+import platform
+import sys
+from threading import Lock
+import time
+
+class NullProfiler:
+    # used when startup isn't profiled, all methods do nothing
+    def phase(self,name):
+        pass
+
+    def timed(self,name):
+        return nullcontext()
+
+    def milestone(self,name):
+        pass
+
+class StartupProfiler:
+    # measures GUI startup (--profile-startup)
+    # phases = consecutive steps of startup, each one ends when next one starts
+    # events = timed operations that can overlap phases (e.g. in background threads)
+    # milestones = points in time (e.g. first interactive frame), report is written at each one
+    # also counts widgets & images created in each phase and times imports of new modules
+    def __init__(self,report_path):
+        self.report_path = Path(report_path)
+        self.start = time.perf_counter()
+        self.lock = Lock()
+
+        # [{"name": str, "start": ms, "duration": ms, "widgets": {class: count}}]
+        self.phases = []
+        self.current = None
+        # [{"name": str, "start": ms, "duration": ms}]
+        self.events = []
+        # [{"name": str, "time": ms}]
+        self.milestones = []
+        # [{"module": str, "depth": int, "start": ms, "duration": ms}]
+        self.imports = []
+        self.import_depth = 0
+        # {class: count} of all widgets & images
+        self.widgets = Counter()
+
+        # import timer goes first, so that tkinter (imported by counters) is measured too
+        self.install_import_timer()
+        self.phase("import")
+        self.install_counters()
+
+    def now(self):
+        # ms since start of profiling
+        return (time.perf_counter() - self.start) * 1000
+
+    #region HOOKS
+    def install_counters(self):
+        # counts every widget (tk & ttk) and image (PhotoImage, also from PIL.ImageTk if it is used)
+        import tkinter as tk
+        profiler = self
+
+        for base in (tk.BaseWidget, tk.Image):
+            def counting_init(obj,*args,original=base.__init__,**kwargs):
+                profiler.count(type(obj).__name__)
+                original(obj,*args,**kwargs)
+
+            base.__init__ = counting_init
+
+    def count(self,cls_name):
+        self.widgets[cls_name] += 1
+        if self.current is not None:
+            self.current["widgets"][cls_name] += 1
+
+    def install_import_timer(self):
+        # times imports of modules that weren't imported yet
+        # (including nested ones, with their depth)
+        profiler = self
+        original_import = builtins.__import__
+
+        def timed_import(name,*args,**kwargs):
+            if name in sys.modules:
+                return original_import(name,*args,**kwargs)
+
+            start = profiler.now()
+            profiler.import_depth += 1
+            try:
+                return original_import(name,*args,**kwargs)
+            finally:
+                profiler.import_depth -= 1
+                with profiler.lock:
+                    profiler.imports.append({"module": name, "depth": profiler.import_depth, "start": start, "duration": profiler.now()-start})
+
+        builtins.__import__ = timed_import
+    #endregion
+
+    #region MEASURING
+    def end_phase(self):
+        if self.current is not None:
+            self.current["duration"] = self.now() - self.current["start"]
+            self.current["widgets"] = dict(self.current["widgets"])
+            self.phases.append(self.current)
+            self.current = None
+
+    def phase(self,name):
+        # ends current phase and starts a new one
+        self.end_phase()
+        self.current = {"name": name, "start": self.now(), "duration": None, "widgets": Counter()}
+
+    @contextmanager
+    def timed(self,name):
+        start = self.now()
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.events.append({"name": name, "start": start, "duration": self.now()-start})
+
+    def milestone(self,name):
+        # ends current phase and writes report
+        self.end_phase()
+        self.milestones.append({"name": name, "time": self.now()})
+        self.write_report()
+    #endregion
+
+    #region REPORT
+    def get_report(self):
+        # (already imported by GUI)
+        import tkinter as tk
+
+        report = {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "tk": tk.TkVersion
+        }
+
+        # (nothing may be imported while holding lock, because import timer needs it too)
+        with self.lock:
+            report.update({
+                "phases": list(self.phases),
+                "events": list(self.events),
+                "milestones": list(self.milestones),
+                "imports": sorted(self.imports,key=lambda item: item["start"]),
+                "widgets": dict(self.widgets)
+            })
+
+        return report
+
+    def write_report(self):
+        report = self.get_report()
+
+        with open(self.report_path,"w",encoding="utf-8") as f:
+            json.dump(report,f,indent=2)
+
+        # short summary
+        lines = [f"Startup profile ({self.report_path}):"]
+        for phase in report["phases"]:
+            widgets = sum(phase["widgets"].values())
+            lines.append(f'  {phase["name"]:<28}{phase["duration"]:>9.1f} ms  {widgets:>5} widgets')
+        for event in report["events"]:
+            lines.append(f'  [{event["name"]}]'.ljust(30) + f'{event["duration"]:>9.1f} ms')
+        for milestone in report["milestones"]:
+            lines.append(f'  -> {milestone["name"]} at {milestone["time"]:.1f} ms')
+        # slowest top-level imports
+        for item in sorted((item for item in report["imports"] if item["depth"] == 0),key=lambda item: -item["duration"])[:5]:
+            lines.append(f'  import {item["module"]:<21}{item["duration"]:>9.1f} ms')
+        print("\n".join(lines),file=sys.stderr)
+    #endregion
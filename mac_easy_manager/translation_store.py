@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+from threading import Lock
+
+#region FILE STRUCTURE
+# config > translations > index.json
+# {"by_code": {"en-US": "English (US)", ...}}
+# (languages sorted by name)
+# config > translations > {code}.json
+# {"Personal": "Personal", "Work": "Work", "Banking": "Banking", "Shopping": "Shopping", "None": "No Container"}
+#endregion
+
+class TranslationStore:
+    # translations of default containers' names
+    # only list of languages is read at start, each language is read from its own file when first needed
+    def __init__(self,folder_path=Path("config","translations")):
+        self.folder_path = Path(folder_path)
+
+        with open(self.folder_path / "index.json",encoding="utf-8") as f:
+            # {code: language}
+            self.by_code = json.load(f)["by_code"]
+        # {language: code}
+        self.codes = {name: code for code, name in self.by_code.items()}
+
+        # {language: {container: translation}}
+        # can be read from ignore preview thread too
+        self.loaded = {}
+        self.lock = Lock()
+
+    def languages(self):
+        return list(self.codes)
+
+    def __contains__(self,name):
+        return name in self.codes
+
+    def __getitem__(self,name):
+        # {container: translation} of given language
+        with self.lock:
+            translations = self.loaded.get(name)
+            if translations is None:
+                with open(self.folder_path / f"{self.codes[name]}.json",encoding="utf-8") as f:
+                    translations = json.load(f)
+                self.loaded[name] = translations
+
+        return translations
+
+    def __getstate__(self):
+        # sent to batch worker processes without loaded languages and lock
+        return {"folder_path": self.folder_path, "by_code": self.by_code, "codes": self.codes}
+
+    def __setstate__(self,state):
+        self.__dict__.update(state)
+        self.loaded = {}
+        self.lock = Lock()
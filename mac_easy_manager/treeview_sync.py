@@ -0,0 +1,91 @@
+from bisect import bisect_left
+
+def longest_increasing(items,key):
+    # returns items forming the longest subsequence with increasing key
+    # (patience sorting, O(n log n))
+    tail_keys = []
+    tail_indices = []
+    prev_indices = [None] * len(items)
+
+    for index, item in enumerate(items):
+        item_key = key[item]
+        pos = bisect_left(tail_keys,item_key)
+
+        if pos:
+            prev_indices[index] = tail_indices[pos-1]
+
+        if pos == len(tail_keys):
+            tail_keys.append(item_key)
+            tail_indices.append(index)
+        else:
+            tail_keys[pos] = item_key
+            tail_indices[pos] = index
+
+    # walks back from the end of the longest subsequence
+    result = []
+    index = tail_indices[-1] if tail_indices else None
+    while index is not None:
+        result.append(items[index])
+        index = prev_indices[index]
+
+    return result
+
+class TreeviewSync:
+    # keeps a flat Treeview in sync with a list of rows
+    # by applying only the needed inserts, deletes, moves and item updates
+    def __init__(self,treeview,images):
+        self.treeview = treeview
+        # {image name: image}
+        self.images = images
+
+        # current item IDs in Treeview order
+        self.items = []
+        # {item ID: (text, image name)}
+        self.rows = {}
+        # {item ID: index}
+        self.positions = {}
+
+    def index(self,item):
+        return self.positions[item]
+
+    def update(self,rows):
+        # rows = list of (item ID, text, image name)
+        # item IDs are strings, like the ones returned by Treeview
+        new_items = [str(item) for item, _, _ in rows]
+        new_positions = {item: index for index, item in enumerate(new_items)}
+
+        # deletes items that are gone
+        deleted = [item for item in self.items if item not in new_positions]
+        if deleted:
+            self.treeview.delete(*deleted)
+
+        # items that stay in the longest run of unchanged relative order don't have to be moved
+        kept = [item for item in self.items if item in new_positions]
+        staying = set(longest_increasing(kept,new_positions))
+
+        # detaches the rest, so that the staying ones are exactly in new order
+        # and moved items can be reattached at their final index
+        moved = [item for item in kept if item not in staying]
+        if moved:
+            self.treeview.detach(*moved)
+
+        new_rows = {}
+        for index, (item, (_, text, image_name)) in enumerate(zip(new_items,rows)):
+            row = (text, image_name)
+            new_rows[item] = row
+
+            # args = parent ("" = toplevel entry), index, id
+            if item not in self.rows:
+                self.treeview.insert("",index,item,text=text,image=self.images[image_name])
+                continue
+
+            if item not in staying:
+                self.treeview.move(item,"",index)
+
+            # updates text & image only if they changed
+            if self.rows[item] != row:
+                self.treeview.item(item,text=text,image=self.images[image_name])
+
+        self.items = new_items
+        self.rows = new_rows
+        self.positions = new_positions
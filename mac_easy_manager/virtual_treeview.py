@@ -0,0 +1,290 @@
+from tkinter import ttk
+
+class VirtualTreeview:
+    # flat list view that only creates Treeview items for the visible rows
+    # and reuses them while scrolling
+    # mimics the part of ttk.Treeview API used for containers list
+    # (selection, see, index, yview, identify_row, <<TreeviewSelect>> event)
+    def __init__(self,master,images,height=13):
+        # {image name: image}
+        self.images = images
+        self.height = height
+
+        # selection is handled here, so Treeview itself doesn't select anything
+        # show: tree = without header
+        self.tree = ttk.Treeview(master,height=height,selectmode="none",show="tree")
+
+        # colors of selected rows are taken from current theme
+        style = ttk.Style()
+        self.tree.tag_configure("selected",background=style.lookup("Treeview","background",["selected"],"#4a6984"),foreground=style.lookup("Treeview","foreground",["selected"],"white"))
+
+        # recycled rows, row{N} = N-th visible row
+        self.slots = [f"row{slot}" for slot in range(height)]
+        for slot in self.slots:
+            self.tree.insert("","end",slot)
+        # what each row shows now, to update only changed rows
+        self.slot_states = [None] * height
+
+        # rows = list of (item ID, text, image name)
+        self.rows = []
+        self.items = []
+        # {item ID: index}
+        self.positions = {}
+        # IDs of selected items
+        self.selected = set()
+        # item from which Shift+click selects
+        self.anchor = None
+        # selected item pressed while more items were selected
+        # (selection is reduced to it on release, unless mouse left it, so that selection can be dragged)
+        self.pressed_item = None
+        # index of first visible row
+        self.offset = 0
+
+        self.yscrollcommand = None
+
+        # own bindtag between widget and class bindings
+        # so that bindings made by user of the widget still work,
+        # while default Treeview bindings are skipped
+        self.bindtag = f"VirtualTreeview{id(self)}"
+        tags = list(self.tree.bindtags())
+        tags.insert(tags.index(self.tree.winfo_class()),self.bindtag)
+        self.tree.bindtags(tuple(tags))
+
+        self.tree.bind_class(self.bindtag,"<Button-1>",self.handle_click)
+        self.tree.bind_class(self.bindtag,"<B1-Motion>",self.handle_drag)
+        self.tree.bind_class(self.bindtag,"<ButtonRelease-1>",self.handle_release)
+        self.tree.bind_class(self.bindtag,"<Control-Button-1>",self.handle_ctrl_click)
+        self.tree.bind_class(self.bindtag,"<Shift-Button-1>",self.handle_shift_click)
+        self.tree.bind_class(self.bindtag,"<Up>",lambda _: self.handle_arrow(-1))
+        self.tree.bind_class(self.bindtag,"<Down>",lambda _: self.handle_arrow(1))
+        self.tree.bind_class(self.bindtag,"<Prior>",lambda _: self.handle_scroll(-self.height))
+        self.tree.bind_class(self.bindtag,"<Next>",lambda _: self.handle_scroll(self.height))
+        # Windows & macOS
+        self.tree.bind_class(self.bindtag,"<MouseWheel>",lambda event: self.handle_scroll(-3 if event.delta > 0 else 3))
+        # Linux
+        self.tree.bind_class(self.bindtag,"<Button-4>",lambda _: self.handle_scroll(-3))
+        self.tree.bind_class(self.bindtag,"<Button-5>",lambda _: self.handle_scroll(3))
+
+    #region WIDGET METHODS
+    def grid(self,**kwargs):
+        self.tree.grid(**kwargs)
+
+    def bind(self,sequence,func,add=None):
+        return self.tree.bind(sequence,func,add)
+
+    def config(self,**kwargs):
+        if "yscrollcommand" in kwargs:
+            self.yscrollcommand = kwargs.pop("yscrollcommand")
+            self.update_scrollbar()
+        if kwargs:
+            self.tree.config(**kwargs)
+    configure = config
+
+    def focus_set(self):
+        self.tree.focus_set()
+    #endregion
+
+    #region ITEMS
+    def set_items(self,rows):
+        # rows = list of (item ID, text, image name)
+        self.rows = [(str(item), text, image_name) for item, text, image_name in rows]
+        self.items = [item for item, _, _ in self.rows]
+        self.positions = {item: index for index, item in enumerate(self.items)}
+
+        # removes items that are gone from selection
+        self.selected = {item for item in self.selected if item in self.positions}
+        if self.anchor not in self.positions:
+            self.anchor = None
+
+        self.scroll_to(self.offset,True)
+
+    def get_children(self):
+        return tuple(self.items)
+
+    def index(self,item):
+        return self.positions[item]
+
+    def identify_row(self,y):
+        # maps visible row to item ID
+        slot = self.tree.identify_row(y)
+        if not slot:
+            return ""
+
+        index = self.offset + self.slots.index(slot)
+        return self.items[index] if index < len(self.items) else ""
+    #endregion
+
+    #region SELECTION
+    @staticmethod
+    def unpack_items(items):
+        # (tuple/list/set of items,) -> items, item IDs themselves are strings or ints
+        if len(items) == 1 and isinstance(items[0],(tuple, list, set, frozenset)):
+            return items[0]
+        return items
+
+    def selection(self):
+        # selected items in list order
+        return tuple(sorted(self.selected,key=self.positions.__getitem__))
+
+    def selection_set(self,*items):
+        # accepts items as separate arguments or as one collection, like Treeview
+        items = self.unpack_items(items)
+
+        self.selected = {str(item) for item in items if str(item) in self.positions}
+        if self.anchor not in self.selected:
+            self.anchor = self.selection()[0] if self.selected else None
+
+        self.render()
+        self.fire_select()
+
+    def selection_remove(self,*items):
+        items = self.unpack_items(items)
+
+        self.selected.difference_update(str(item) for item in items)
+
+        self.render()
+        self.fire_select()
+
+    def fire_select(self):
+        # queued like the event Treeview generates itself
+        self.tree.event_generate("<<TreeviewSelect>>",when="tail")
+    #endregion
+
+    #region SCROLLING
+    def yview(self,*args):
+        # called by scrollbar
+        # ("moveto", fraction) or ("scroll", number, "units"/"pages")
+        if not args:
+            return self.get_fractions()
+
+        if args[0] == "moveto":
+            self.yview_moveto(float(args[1]))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2].startswith("page"):
+                step *= self.height
+            self.scroll_to(self.offset+step)
+
+    def yview_moveto(self,fraction):
+        self.scroll_to(round(fraction*len(self.items)))
+
+    def see(self,item):
+        index = self.positions[str(item)]
+
+        if index < self.offset:
+            self.scroll_to(index)
+        elif index >= self.offset + self.height:
+            self.scroll_to(index-self.height+1)
+
+    def scroll_to(self,offset,force=False):
+        offset = max(0,min(offset,len(self.items)-self.height))
+
+        if offset != self.offset or force:
+            self.offset = offset
+            self.render()
+            self.update_scrollbar()
+
+    def get_fractions(self):
+        if not self.items:
+            return 0.0, 1.0
+
+        return self.offset/len(self.items), min(1.0,(self.offset+self.height)/len(self.items))
+
+    def update_scrollbar(self):
+        if self.yscrollcommand is not None:
+            self.yscrollcommand(*self.get_fractions())
+    #endregion
+
+    #region RENDERING
+    def render(self):
+        # updates only visible rows that show something else than before
+        for slot_index, slot in enumerate(self.slots):
+            index = self.offset + slot_index
+
+            if index < len(self.rows):
+                item, text, image_name = self.rows[index]
+                state = (text, image_name, item in self.selected)
+            else:
+                state = ("", None, False)
+
+            if self.slot_states[slot_index] != state:
+                text, image_name, if_selected = state
+                image = self.images[image_name] if image_name is not None else ""
+                self.tree.item(slot,text=text,image=image,tags=("selected",) if if_selected else ())
+                self.slot_states[slot_index] = state
+    #endregion
+
+    #region EVENT HANDLERS
+    def handle_click(self,event):
+        # default bindings (and focus on click) are skipped, so focus is set here
+        self.tree.focus_set()
+
+        item = self.identify_row(event.y)
+        self.pressed_item = None
+        if item:
+            self.anchor = item
+            # keeps multiple selection, it may be dragged
+            if item in self.selected and len(self.selected) > 1:
+                self.pressed_item = item
+            else:
+                self.selection_set(item)
+
+        return "break"
+
+    def handle_drag(self,event):
+        # selection is being dragged, so it's kept
+        if self.pressed_item is not None and self.identify_row(event.y) != self.pressed_item:
+            self.pressed_item = None
+
+    def handle_release(self,event):
+        # it was just a click on selected item
+        if self.pressed_item is not None:
+            if self.pressed_item in self.positions:
+                self.selection_set(self.pressed_item)
+            self.pressed_item = None
+
+    def handle_ctrl_click(self,event):
+        self.tree.focus_set()
+
+        # toggles clicked item
+        item = self.identify_row(event.y)
+        if item:
+            self.anchor = item
+            self.selection_set(self.selected ^ {item})
+
+        return "break"
+
+    def handle_shift_click(self,event):
+        self.tree.focus_set()
+
+        # selects range from anchor to clicked item
+        item = self.identify_row(event.y)
+        if item:
+            anchor = self.anchor if self.anchor is not None else item
+            start, end = sorted((self.positions[anchor], self.positions[item]))
+            self.selection_set(self.items[start:end+1])
+            self.anchor = anchor
+
+        return "break"
+
+    def handle_arrow(self,direction):
+        # selects previous/next item
+        if self.items:
+            selection = self.selection()
+            if selection:
+                index = self.positions[selection[0] if direction < 0 else selection[-1]] + direction
+            else:
+                index = 0
+            item = self.items[max(0,min(index,len(self.items)-1))]
+
+            self.anchor = item
+            self.selection_set(item)
+            self.see(item)
+
+        return "break"
+
+    def handle_scroll(self,step):
+        self.scroll_to(self.offset+step)
+
+        return "break"
+    #endregion
@@ -0,0 +1,45 @@
+import json
+from pathlib import Path
+import sys
+
+import pytest
+
+# app modules are imported as top-level modules, like when running from mac_easy_manager folder
+APP_PATH = Path(__file__).resolve().parent.parent / "mac_easy_manager"
+sys.path.insert(0,str(APP_PATH))
+
+@pytest.fixture
+def app_cwd(monkeypatch):
+    # app reads its config files from paths relative to its folder
+    monkeypatch.chdir(APP_PATH)
+    return APP_PATH
+
+@pytest.fixture
+def profile(tmp_path):
+    # profile folder with containers.json like the one Firefox writes
+    # (default containers, a non-public one, custom ones and an ignored one)
+    identities = [
+        {"userContextId": 1, "public": True, "icon": "fingerprint", "color": "blue", "l10nID": "userContextPersonal.label", "accessKey": "userContextPersonal.accesskey", "telemetryId": 1},
+        {"userContextId": 2, "public": True, "icon": "briefcase", "color": "orange", "l10nID": "userContextWork.label", "accessKey": "userContextWork.accesskey", "telemetryId": 2},
+        {"userContextId": 4, "public": False, "icon": "", "color": "", "name": "userContextIdInternal.thumbnail", "accessKey": ""},
+        {"userContextId": 6, "public": True, "icon": "dollar", "color": "green", "name": "Custom"},
+        {"userContextId": 7, "public": True, "icon": "cart", "color": "red", "name": "Alpha"},
+        {"userContextId": 8, "public": True, "icon": "circle", "color": "toolbar", "name": "tmp1"}
+    ]
+    prof_path = tmp_path / "profile"
+    prof_path.mkdir()
+    with open(prof_path / "containers.json","w",encoding="utf-8") as f:
+        f.write(json.dumps({"version": 4, "lastUserContextId": 8, "identities": identities},separators=(",",":")))
+
+    return prof_path
+
+@pytest.fixture
+def engine(app_cwd,profile):
+    from container_engine import ContainerEngine
+    from translation_store import TranslationStore
+
+    translations = TranslationStore()
+    engine = ContainerEngine(translations)
+    engine.load(profile,translations.by_code["en-US"],"tmp",True)
+
+    return engine
@@ -0,0 +1,128 @@
+import json
+
+def names(engine):
+    return [container["name"] for container in engine.ready_conts]
+
+def test_loaded_is_clean(engine):
+    assert names(engine) == ["Personal", "Work", "Custom", "Alpha"]
+    assert engine.is_saved()
+
+def test_edit_then_undo_is_clean(engine):
+    engine.change_color(["6"],"purple")
+    assert not engine.is_saved()
+
+    assert engine.undo()
+    assert engine.is_saved()
+
+    assert engine.redo()
+    assert not engine.is_saved()
+
+def test_edit_back_by_hand_is_clean(engine):
+    engine.change_icon(["7"],"tree")
+    engine.change_icon(["7"],"cart")
+
+    assert engine.is_saved()
+
+def test_rename_default_then_undo_is_clean(engine):
+    engine.change_name(["1"],"Private")
+    assert not engine.is_saved()
+
+    engine.undo()
+    assert engine.is_saved()
+    assert engine.get_container(1)["accessKey"] == "userContextPersonal.accesskey"
+
+def test_move_then_move_back_is_clean(engine):
+    engine.cont_move_down(["6"])
+    assert names(engine) == ["Personal", "Work", "Alpha", "Custom"]
+    assert not engine.is_saved()
+
+    engine.cont_move_up(["6"])
+    assert engine.is_saved()
+
+def test_sort_then_undo_is_clean(engine):
+    engine.sort(0,1,[0,0,0])
+    assert names(engine) == ["Alpha", "Custom", "Personal", "Work"]
+    assert not engine.is_saved()
+
+    engine.undo()
+    assert names(engine) == ["Personal", "Work", "Custom", "Alpha"]
+    assert engine.is_saved()
+
+def test_sort_redo_after_undo(engine):
+    engine.sort(1,0,[1,0,0])
+    sorted_names = names(engine)
+
+    engine.undo()
+    engine.redo()
+    assert names(engine) == sorted_names
+
+    # only a permutation of positions is kept
+    op = engine.history.undo_stack[-1]
+    assert op[0] == "sort" and len(op) == 2 and len(op[1]) == len(engine.ready_conts)
+
+def test_block_move_then_undo_is_clean(engine):
+    # Personal & Custom to the bottom, then back
+    engine.cont_move_to(["1", "6"],2)
+    assert names(engine) == ["Work", "Alpha", "Personal", "Custom"]
+    assert not engine.is_saved()
+
+    engine.undo()
+    assert names(engine) == ["Personal", "Work", "Custom", "Alpha"]
+    assert engine.is_saved()
+
+    engine.redo()
+    assert names(engine) == ["Work", "Alpha", "Personal", "Custom"]
+
+    # only old positions of moved containers are kept
+    assert engine.history.undo_stack[-1] == ("move_to", engine.history.undo_stack[-1][1], 2)
+    assert list(engine.history.undo_stack[-1][1]) == [0, 2]
+
+def test_block_move_in_place_isnt_recorded(engine):
+    engine.cont_move_to(["6", "7"],2)
+    engine.cont_move_to_top(["1", "2"])
+
+    assert engine.is_saved()
+    assert not engine.history.can_undo()
+
+def test_add_then_delete_is_clean(engine):
+    engine.add_cont("New","blue","circle")
+    assert not engine.is_saved()
+
+    engine.delete_cont([str(engine.last_id)])
+    assert engine.is_saved()
+
+def test_delete_then_undo_is_clean(engine):
+    engine.delete_cont(["2", "7"])
+    assert names(engine) == ["Personal", "Custom"]
+    assert not engine.is_saved()
+
+    engine.undo()
+    assert names(engine) == ["Personal", "Work", "Custom", "Alpha"]
+    assert engine.is_saved()
+
+def test_save_then_undo_is_dirty(engine,tmp_path):
+    engine.change_color(["6"],"purple")
+    engine.save("test",tmp_path / "backups",fsync=False)
+    assert engine.is_saved()
+
+    # saved file has the change, so going back to previous state is a change
+    engine.undo()
+    assert not engine.is_saved()
+
+    engine.redo()
+    assert engine.is_saved()
+
+def test_rename_default_then_undo_keeps_keys_order(engine,profile,tmp_path):
+    def read_identities():
+        # {userContextId: [(key, value)]}, keys in file order
+        # (ignored containers are saved after the others, so identities are compared by ID)
+        with open(profile / "containers.json",encoding="utf-8") as f:
+            return {identity["userContextId"]: list(identity.items()) for identity in json.load(f)["identities"]}
+
+    original = read_identities()
+
+    engine.change_name(["1", "2"],"Private")
+    engine.undo()
+    engine.save("test",tmp_path / "backups",fsync=False)
+
+    assert read_identities() == original
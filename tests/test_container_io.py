@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from container_io import COMPACT_ENCODER, iter_containers, iterencode_containers, write_atomic
+
+class ChunkedReader:
+    # file-like object returning at most n characters per read,
+    # so that values are split between chunks at every possible place
+    def __init__(self,text,n):
+        self.text = text
+        self.n = n
+        self.pos = 0
+
+    def read(self,size=-1):
+        chunk = self.text[self.pos:self.pos+self.n]
+        self.pos += len(chunk)
+        return chunk
+
+IDENTITIES = [
+    {"userContextId": 1, "public": True, "icon": "fingerprint", "color": "blue", "l10nID": "userContextPersonal.label", "accessKey": "userContextPersonal.accesskey", "telemetryId": 1},
+    {"userContextId": 5, "public": False, "icon": "", "color": "", "name": "userContextIdInternal.thumbnail", "accessKey": ""},
+    {"userContextId": 6, "public": True, "icon": "dollar", "color": "green", "name": "Quote \" backslash \\ slash / tab \t newline \n"},
+    {"userContextId": 7, "public": True, "icon": "cart", "color": "red", "name": "Zażółć 😀 \u0000  ", "score": -2.5e-3, "extra": {"list": [1, 2.0, None, False]}}
+]
+
+def parse(text,n):
+    header = {}
+    identities = list(iter_containers(ChunkedReader(text,n),header))
+    return header, identities
+
+@pytest.mark.parametrize("n",[1, 2, 3, 7, 64, 1 << 16])
+@pytest.mark.parametrize("ensure_ascii",[True, False])
+def test_chunk_boundaries_in_strings_and_escapes(n,ensure_ascii):
+    # escapes (\", \\, \n, \uXXXX and surrogate pairs) are split between chunks too
+    data = {"version": 4, "lastUserContextId": 7, "identities": IDENTITIES}
+    text = json.dumps(data,ensure_ascii=ensure_ascii,indent=2)
+
+    header, identities = parse(text,n)
+
+    assert identities == IDENTITIES
+    assert header == {"version": 4, "lastUserContextId": 7, "identities": None}
+
+@pytest.mark.parametrize("n",[1, 5, 1 << 16])
+def test_header_keys_before_and_after_identities(n):
+    text = json.dumps({"version": 4, "identities": IDENTITIES, "lastUserContextId": 7, "future": {"a": [1, 2]}})
+
+    header, identities = parse(text,n)
+
+    # keys keep file order, identities only as placeholder
+    assert list(header.items()) == [("version", 4), ("identities", None), ("lastUserContextId", 7), ("future", {"a": [1, 2]})]
+    assert identities == IDENTITIES
+
+@pytest.mark.parametrize("text",['{"version":4,"lastUserContextId":0,"identities":[]}', '{ "version" : 4 , "identities" : [ ] , "lastUserContextId" : 0 }\n'])
+def test_empty_identities(text):
+    header, identities = parse(text,3)
+
+    assert identities == []
+    assert header["identities"] is None
+    assert "".join(iterencode_containers(header,[])) == COMPACT_ENCODER.encode({**header, "identities": []})
+
+@pytest.mark.parametrize("text",['{"version":4,"identities":[{"a":1},]}', '{"version":4,"identities":[{"a":1}]', '{"version":4} {}', '{"version":-}', '[]'])
+def test_invalid_json(text):
+    with pytest.raises(ValueError):
+        parse(text,2)
+
+@pytest.mark.parametrize("n",[1, 1 << 16])
+def test_round_trip(tmp_path,n):
+    # file written by Firefox (compact) is written back byte for byte
+    path = tmp_path / "containers.json"
+    text = COMPACT_ENCODER.encode({"version": 4, "lastUserContextId": 7, "identities": IDENTITIES, "after": True})
+    path.write_text(text,encoding="utf-8")
+
+    with open(path,encoding="utf-8") as f:
+        header, identities = parse(f.read(),n)
+
+    write_atomic(path,iterencode_containers(header,iter(identities)),fsync=False)
+
+    assert path.read_text(encoding="utf-8") == text
+    assert [file.name for file in tmp_path.iterdir()] == ["containers.json"]
+
+def test_failed_encoding_leaves_file_and_no_temp_file(tmp_path):
+    path = tmp_path / "containers.json"
+    path.write_text('{"identities":[]}',encoding="utf-8")
+
+    # 2nd identity can't be encoded, after 1st one was already written
+    identities = [IDENTITIES[0], {"userContextId": 2, "name": object()}]
+
+    with pytest.raises(TypeError):
+        write_atomic(path,iterencode_containers({"version": 4, "identities": None},identities))
+
+    assert path.read_text(encoding="utf-8") == '{"identities":[]}'
+    assert [file.name for file in tmp_path.iterdir()] == ["containers.json"]
+
+def test_new_file(tmp_path):
+    path = tmp_path / "new.json"
+
+    write_atomic(path,["{", "}"])
+
+    assert path.read_text(encoding="utf-8") == "{}"
+    assert [file.name for file in tmp_path.iterdir()] == ["new.json"]
@@ -0,0 +1,53 @@
+import re
+
+import pytest
+
+from ignore_matcher import IgnoreMatcher, split_patterns
+
+def test_prefix_followed_by_digits():
+    matcher = IgnoreMatcher(["tmp"])
+
+    assert matcher.classify(["tmp", "tmp1", "tmp123", "tmpx", "tmp1x", "xtmp1", "Tmp1"]) == [True, True, True, False, False, False, False]
+
+def test_prefix_ending_with_digits():
+    matcher = IgnoreMatcher(["tmp1"])
+
+    assert matcher.classify(["tmp", "tmp1", "tmp12"]) == [False, True, True]
+
+def test_ignore_case():
+    matcher = IgnoreMatcher(["Tmp"],if_ignore_case=True)
+
+    assert matcher.classify(["tmp1", "TMP2", "tMp", "temp"]) == [True, True, True, False]
+
+def test_plain_text_is_literal():
+    # regex characters in plain text are matched as they are
+    matcher = IgnoreMatcher(["a.b"])
+
+    assert matcher.classify(["a.b1", "axb1"]) == [True, False]
+
+def test_plain_text_is_split_on_commas():
+    assert split_patterns("tmp, temp,,") == ("tmp", "temp")
+    assert IgnoreMatcher(split_patterns("tmp, temp")).classify(["tmp1", "temp2", "tmptemp"]) == [True, True, False]
+
+def test_regex_is_taken_whole():
+    # commas and alternation belong to the regex
+    assert split_patterns("a{1,2}|b",True) == ("a{1,2}|b",)
+    assert split_patterns("",True) == ()
+
+def test_regexes_joined_into_one():
+    matcher = IgnoreMatcher(["work.*", r"bank\d+"],if_regex=True)
+
+    assert matcher.classify(["work", "workshop", "bank12", "bank", "my work"]) == [True, True, True, False, False]
+
+def test_regex_fullmatch_and_ignore_case():
+    matcher = IgnoreMatcher(["te?mp"],if_regex=True,if_ignore_case=True)
+
+    assert matcher.classify(["TMP", "temp", "temp1"]) == [True, True, False]
+
+def test_invalid_regex():
+    with pytest.raises(re.error):
+        IgnoreMatcher(["tmp("],if_regex=True)
+
+def test_no_patterns():
+    assert IgnoreMatcher([]).classify(["tmp1", ""]) == [False, False]
+    assert IgnoreMatcher([],if_regex=True).classify(["tmp1"]) == [False]
@@ -0,0 +1,61 @@
+import json
+
+from sort_presets import DEFAULT_PRESET, SortPresets, preset_to_spec
+
+OLD_OPTIONS = {"primary": ["0", 1], "secondary": ["1", 0], "tertiary": 0}
+
+def test_old_file_is_read_as_default_preset_and_saved_in_new_format(tmp_path):
+    path = tmp_path / "sorting_options.json"
+    path.write_text(json.dumps(OLD_OPTIONS),encoding="utf-8")
+
+    presets = SortPresets(path)
+    assert presets.names() == [DEFAULT_PRESET]
+    assert presets[DEFAULT_PRESET] == OLD_OPTIONS
+
+    presets.save_preset("by color",{"primary": ["1", 0], "secondary": ["2", 1], "tertiary": 1})
+
+    with open(path,encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["presets"][DEFAULT_PRESET] == OLD_OPTIONS
+    assert data["profiles"] == {}
+
+    reloaded = SortPresets(path)
+    assert reloaded.names() == ["by color", DEFAULT_PRESET]
+    assert reloaded[DEFAULT_PRESET] == OLD_OPTIONS
+    assert preset_to_spec(reloaded["by color"]) == (1, 2, [0, 1, 1])
+
+def test_profile_binding(tmp_path):
+    path = tmp_path / "sorting_options.json"
+    prof_path = tmp_path / "Profiles" / "abc.default"
+
+    presets = SortPresets(path)
+    assert presets.get_binding(prof_path) is None
+
+    presets.save_preset("mine",OLD_OPTIONS)
+    presets.bind(prof_path,"mine")
+
+    # same folder given by another path
+    reloaded = SortPresets(path)
+    assert reloaded.get_binding(tmp_path / "Profiles" / ".." / "Profiles" / "abc.default") == "mine"
+    assert reloaded.get_binding(tmp_path / "other") is None
+
+    # deleting preset unbinds it
+    reloaded.delete_preset("mine")
+    assert SortPresets(path).get_binding(prof_path) is None
+
+def test_unbind_and_missing_preset(tmp_path):
+    path = tmp_path / "sorting_options.json"
+    prof_path = tmp_path / "profile"
+
+    presets = SortPresets(path)
+    presets.save_preset("mine",OLD_OPTIONS)
+    presets.bind(prof_path,"mine")
+    presets.bind(prof_path,None)
+    assert SortPresets(path).get_binding(prof_path) is None
+
+    # binding to preset removed by hand is ignored
+    path.write_text(json.dumps({"presets": {}, "profiles": {SortPresets.profile_key(prof_path): "gone"}}),encoding="utf-8")
+    assert SortPresets(path).get_binding(prof_path) is None
+
+def test_unsorted_preset():
+    assert preset_to_spec({"primary": ["None", 0], "secondary": ["None", 0], "tertiary": 0}) is None
@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+import pytest
+
+from virtual_treeview import VirtualTreeview
+
+class FakeTreeview(VirtualTreeview):
+    # selection logic without Tk: nothing is drawn, clicks are given as item IDs (event.y)
+    def __init__(self,items):
+        self.height = 3
+        self.rows = []
+        self.items = []
+        self.positions = {}
+        self.selected = set()
+        self.anchor = None
+        self.pressed_item = None
+        self.offset = 0
+        self.yscrollcommand = None
+        self.tree = SimpleNamespace(focus_set=lambda: None)
+        self.select_events = 0
+
+        self.set_items([(item, f"Container {item}", None) for item in items])
+
+    def render(self):
+        pass
+
+    def fire_select(self):
+        self.select_events += 1
+
+    def identify_row(self,y):
+        return y
+
+def click(item):
+    return SimpleNamespace(y=item)
+
+@pytest.fixture
+def tree():
+    return FakeTreeview(["1", "2", "3", "4", "5"])
+
+def test_selection_set_accepts_any_collection(tree):
+    tree.selection_set("1","3")
+    assert tree.selection() == ("1", "3")
+
+    tree.selection_set(["4", 2])
+    assert tree.selection() == ("2", "4")
+
+    tree.selection_set({"5", "1"})
+    assert tree.selection() == ("1", "5")
+
+    tree.selection_set(("3",))
+    assert tree.selection() == ("3",)
+
+    # unknown items are skipped
+    tree.selection_set(["3", "9"])
+    assert tree.selection() == ("3",)
+    assert tree.select_events == 5
+
+def test_selection_remove(tree):
+    tree.selection_set(tree.get_children())
+    tree.selection_remove({"2", "4"})
+    assert tree.selection() == ("1", "3", "5")
+
+def test_click_selects_one(tree):
+    tree.selection_set("1","2")
+    tree.handle_click(click("4"))
+    assert tree.selection() == ("4",)
+
+def test_ctrl_click_toggles(tree):
+    tree.handle_click(click("1"))
+    tree.handle_ctrl_click(click("2"))
+    assert tree.selection() == ("1", "2")
+
+    tree.handle_ctrl_click(click("4"))
+    assert tree.selection() == ("1", "2", "4")
+
+    tree.handle_ctrl_click(click("1"))
+    assert tree.selection() == ("2", "4")
+
+def test_shift_click_selects_range_from_anchor(tree):
+    tree.handle_click(click("2"))
+    tree.handle_shift_click(click("4"))
+    assert tree.selection() == ("2", "3", "4")
+
+    # anchor stays, so range can be changed
+    tree.handle_shift_click(click("1"))
+    assert tree.selection() == ("1", "2")
+
+def test_click_on_selected_keeps_selection_until_release(tree):
+    tree.selection_set("2","3","4")
+    tree.handle_click(click("3"))
+    assert tree.selection() == ("2", "3", "4")
+
+    # released on the same row = just a click
+    tree.handle_drag(click("3"))
+    tree.handle_release(click("3"))
+    assert tree.selection() == ("3",)
+
+def test_dragging_selected_keeps_selection(tree):
+    tree.selection_set("2","3")
+    tree.handle_click(click("2"))
+    tree.handle_drag(click("5"))
+    tree.handle_release(click("5"))
+    assert tree.selection() == ("2", "3")
+
+def test_set_items_drops_missing_from_selection(tree):
+    tree.selection_set("1","5")
+    tree.set_items([("1", "Container 1", None), ("2", "Container 2", None)])
+    assert tree.selection() == ("1",)
+    tree.set_items([])
+    assert tree.selection() == ()
@@ -23,3 +23,48 @@ parser.add_argument(
     choices=["DEBUG","INFO"],
     help="Sets the logging level."
 )
+
+benchmark_parser = ArgumentParser(description="Measures core operations on synthetic profiles and prints results as JSON.")
+
+benchmark_parser.add_argument(
+    "-s","--sizes",
+    nargs="+",
+    type=int,
+    default=[10,100,1000,10000,100000],
+    help="Numbers of identities in generated containers.json files."
+    )
+
+benchmark_parser.add_argument(
+    "-r","--repeat",
+    default=5,
+    type=int,
+    help="Determines how many times each operation is measured."
+    )
+
+benchmark_parser.add_argument(
+    "-o","--output",
+    help="Path to write JSON results to (printed to standard output by default)."
+    )
+
+benchmark_parser.add_argument(
+    "--seed",
+    default=0,
+    type=int,
+    help="Seed for generating containers."
+    )
+
+benchmark_parser.add_argument(
+    "--fsync",
+    action="store_const",
+    const=True,
+    default=False,
+    help="Flushes saved files to disk like the program does (slower and noisier)."
+    )
+
+benchmark_parser.add_argument(
+    "--no-gui",
+    action="store_const",
+    const=True,
+    default=False,
+    help="Skips GUI operations (they need a display, e.g. run under xvfb-run)."
+    )
@@ -0,0 +1,252 @@
+from argparser import benchmark_parser
+import json
+import os
+from pathlib import Path
+import platform
+import random
+import shutil
+from statistics import median
+import sys
+import tempfile
+import time
+
+# measures core operations on generated profiles of different sizes
+# run from anywhere, e.g.:
+# python utils/benchmark.py --sizes 1000 100000 -o results.json
+# GUI operations need a display (on Linux without one: xvfb-run python utils/benchmark.py)
+APP_PATH = Path(__file__).resolve().parent.parent / "mac_easy_manager"
+
+# appended (not inserted), so that utils/argparser.py isn't shadowed by the app's one
+sys.path.append(str(APP_PATH))
+from container_engine import ContainerEngine, get_profiles, profile_dirs_cache, profiles_ini_cache
+from translation_store import TranslationStore
+
+# default containers, as Firefox creates them
+DEFAULT_CONTAINERS = [
+    ("Personal", "fingerprint", "blue"),
+    ("Work", "briefcase", "orange"),
+    ("Banking", "dollar", "green"),
+    ("Shopping", "cart", "pink")
+]
+CUSTOM_NAMES = ["Social", "Mail", "Dev", "Test", "News", "Video", "Music", "Games", "Travel", "Docs"]
+# ignored with default ignore option ("tmp", from Temporary Containers extension)
+IGNORED_PREFIX = "tmp"
+LANGUAGE_CODE = "en-US"
+
+# MACEasyManager, created for 1st profile measured and reused for the rest
+gui_app = None
+
+#region GENERATING
+def generate_identities(count,colors,icons,rng):
+    # 4 default containers, 1 non-public one, then mix of:
+    # 75% custom, 20% ignored (tmpN), 5% non-public
+    identities = []
+
+    for cont_id, (name, icon, color) in enumerate(DEFAULT_CONTAINERS[:count],1):
+        identities.append({"userContextId": cont_id, "public": True, "icon": icon, "color": color, "l10nID": f"userContext{name}.label", "accessKey": f"userContext{name}.accesskey", "telemetryId": cont_id})
+
+    for cont_id in range(len(identities)+1,count+1):
+        kind = rng.random()
+        if cont_id == 5 or kind >= 0.95:
+            identities.append({"userContextId": cont_id, "public": False, "icon": "", "color": "", "name": f"userContextIdInternal.{cont_id}", "accessKey": ""})
+        elif kind >= 0.75:
+            identities.append({"userContextId": cont_id, "public": True, "icon": "circle", "color": "toolbar", "name": f"{IGNORED_PREFIX}{cont_id}"})
+        else:
+            identities.append({"userContextId": cont_id, "public": True, "icon": rng.choice(icons), "color": rng.choice(colors), "name": f"{rng.choice(CUSTOM_NAMES)} {rng.randrange(count)}"})
+
+    return identities
+
+def generate_profiles(folder_path,sizes,seed):
+    # Firefox data folder with profiles.ini and one profile (bench-{size}) per size
+    # returns {size: profile path}
+    with open(APP_PATH / "config" / "original_order.json",encoding="utf-8") as f:
+        orig_order = json.load(f)
+    rng = random.Random(seed)
+
+    ini_lines = []
+    prof_paths = {}
+    for ind, size in enumerate(sizes):
+        rel_path = f"Profiles/bench-{size}"
+        prof_path = folder_path / rel_path
+        prof_path.mkdir(parents=True)
+
+        with open(prof_path / "containers.json","w",encoding="utf-8") as f:
+            json.dump({"version": 4, "lastUserContextId": size, "identities": generate_identities(size,orig_order["color"],orig_order["icon"],rng)},f)
+
+        ini_lines += [f"[Profile{ind}]", f"Name=bench-{size}", "IsRelative=1", f"Path={rel_path}", ""]
+        prof_paths[size] = prof_path
+
+    with open(folder_path / "profiles.ini","w",encoding="utf-8") as f:
+        f.write("\n".join(ini_lines))
+
+    return prof_paths
+#endregion
+
+#region MEASURING
+def measure(operation,setup=None,repeat=5):
+    # runs setup (not measured) and operation repeat times
+    # returns times in ms
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+
+        start = time.perf_counter()
+        operation()
+        times.append((time.perf_counter() - start) * 1000)
+
+    return times
+
+def to_result(operation,size,times,**extra):
+    return {"operation": operation, "size": size, **extra, "min": min(times), "median": median(times), "max": max(times), "times": times}
+
+def pick_ids(containers,share=0.01):
+    # IDs of ~1% of containers, spread over the whole list (at least 1)
+    step = max(1,int(1/share))
+    return tuple(str(container["userContextId"]) for container in containers[::step])
+
+def bench_engine(prof_path,size,translations,language,backup_path,repeat,fsync):
+    results = []
+    engine = ContainerEngine(translations)
+
+    def load():
+        engine.load(prof_path,language,IGNORED_PREFIX,True)
+
+    times = measure(load,repeat=repeat)
+    results.append(to_result("get_containers",size,times,ready=len(engine.ready_conts),ignored=len(engine.ignored_conts)))
+
+    # by name, then color (containers are reloaded, so that they're never already sorted)
+    times = measure(lambda: engine.sort(0,1,[0,0,0]),engine.get_containers,repeat)
+    results.append(to_result("sort",size,times))
+
+    selections = pick_ids(engine.ready_conts)
+    times = measure(lambda: engine.delete_cont(selections),engine.get_containers,repeat)
+    results.append(to_result("delete_cont",size,times,selected=len(selections)))
+
+    # saves sorted containers (file keeps the same set of containers)
+    def before_save():
+        shutil.rmtree(backup_path,ignore_errors=True)
+        engine.get_containers()
+        engine.sort(0,1,[0,0,0])
+
+    times = measure(lambda: engine.save(f"bench-{size}",backup_path,fsync),before_save,repeat)
+    results.append(to_result("save",size,times,fsync=fsync))
+
+    return results
+
+def bench_gui(prof_path,size,repeat):
+    # drives real main window without mainloop (window stays withdrawn)
+    from mac_easy_manager import MACEasyManager
+    global gui_app
+
+    if gui_app is None:
+        gui_app = MACEasyManager()
+        gui_app.root.withdraw()
+    app = gui_app
+
+    results = []
+    name = f"bench-{size}"
+
+    def select_profile():
+        app.prof_dict[name] = {"path": prof_path, "is_default": False}
+        app.profile_radiobtn_var.set(name)
+        app.root.update()
+
+    # 1st time includes building main window
+    times = measure(app.main_window,select_profile,repeat)
+    results.append(to_result("open_profile",size,times,first=times[0]))
+
+    def before_refresh():
+        app.get_containers()
+        app.engine.sort(0,1,[0,0,0])
+        app.root.update()
+
+    times = measure(app.refresh_conts,before_refresh,repeat)
+    results.append(to_result("refresh_conts",size,times))
+
+    def reload():
+        app.get_containers()
+        app.refresh_conts()
+        app.cont_treeview.selection_set(pick_ids(app.engine.ready_conts))
+        app.root.update()
+
+    reload()
+    selected = len(app.cont_treeview.selection())
+    times = measure(app.cont_handle_select,reload,repeat)
+    results.append(to_result("cont_handle_select",size,times,selected=selected))
+
+    times = measure(app.delete_cont,reload,repeat)
+    results.append(to_result("delete_cont_gui",size,times,selected=selected))
+
+    return results
+#endregion
+
+def main(args_dict):
+    # app reads its config files from relative paths
+    os.chdir(APP_PATH)
+
+    translations = TranslationStore()
+    language = translations.by_code[LANGUAGE_CODE]
+
+    report = {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "sizes": args_dict["sizes"],
+        "repeat": args_dict["repeat"],
+        "seed": args_dict["seed"],
+        "gui": None,
+        "results": []
+    }
+
+    with tempfile.TemporaryDirectory() as temp_path:
+        folder_path = Path(temp_path)
+        prof_paths = generate_profiles(folder_path,args_dict["sizes"],args_dict["seed"])
+
+        def clear_profile_caches():
+            profiles_ini_cache.clear()
+            profile_dirs_cache.clear()
+
+        times = measure(lambda: get_profiles(folder_path),clear_profile_caches,args_dict["repeat"])
+        report["results"].append(to_result("get_profiles",len(prof_paths),times))
+
+        for size, prof_path in prof_paths.items():
+            print(f"Measuring {size} identities...",file=sys.stderr)
+            report["results"] += bench_engine(prof_path,size,translations,language,folder_path / "backups",args_dict["repeat"],args_dict["fsync"])
+
+        if args_dict["no_gui"]:
+            report["gui"] = "skipped"
+        else:
+            import tkinter as tk
+
+            try:
+                for size, prof_path in prof_paths.items():
+                    print(f"Measuring GUI with {size} identities...",file=sys.stderr)
+                    report["results"] += bench_gui(prof_path,size,args_dict["repeat"])
+                report["gui"] = "measured"
+            # no display
+            except tk.TclError as e:
+                report["gui"] = f"skipped: {e}"
+                print(f"GUI operations skipped: {e}",file=sys.stderr)
+            finally:
+                if gui_app is not None:
+                    gui_app.preview_executor.shutdown(wait=False,cancel_futures=True)
+                    gui_app.root.destroy()
+
+    return report
+
+if __name__ == "__main__":
+    args_dict = vars(benchmark_parser.parse_args())
+    # resolved before changing folder
+    output_path = Path(args_dict["output"]).resolve() if args_dict["output"] else None
+
+    report = main(args_dict)
+
+    # short summary
+    for result in report["results"]:
+        print(f'{result["operation"]:<20}{result["size"]:>8}{result["median"]:>12.2f} ms',file=sys.stderr)
+
+    if output_path is None:
+        print(json.dumps(report,indent=2))
+    else:
+        with open(output_path,"w",encoding="utf-8") as f:
+            json.dump(report,f,indent=2)
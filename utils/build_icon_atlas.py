@@ -0,0 +1,43 @@
+import json
+from pathlib import Path
+from PIL import Image
+
+# packs all container icons into a single image, so that the app can load them with one file read
+# icons > container_icons > {color} > {icon}.png
+# result:
+# icons > container_icons.png (atlas, one row per color)
+# icons > container_icons.json ({"{color}{icon}": [x, y, width, height]})
+ICONS_PATH = Path(__file__).resolve().parent.parent / "mac_easy_manager" / "icons"
+
+def build_atlas(icons_path=ICONS_PATH):
+    icon_path = icons_path / "container_icons"
+
+    # sorted, so that the atlas doesn't change between builds
+    rows = []
+    for icon_folder in sorted(path for path in icon_path.iterdir() if path.is_dir()):
+        rows.append([(f"{icon_folder.name}{icon.stem}", Image.open(icon).convert("RGBA")) for icon in sorted(icon_folder.glob("*.png"))])
+
+    width = max(sum(image.width for _, image in row) for row in rows)
+    height = sum(max(image.height for _, image in row) for row in rows)
+
+    atlas = Image.new("RGBA",(width,height))
+    offsets = {}
+
+    y = 0
+    for row in rows:
+        x = 0
+        for name, image in row:
+            atlas.paste(image,(x,y))
+            offsets[name] = [x, y, image.width, image.height]
+            x += image.width
+        y += max(image.height for _, image in row)
+
+    atlas.save(icons_path / "container_icons.png",optimize=True)
+
+    with open(icons_path / "container_icons.json","w",encoding="utf-8") as f:
+        json.dump(offsets,f)
+
+    return len(offsets)
+
+if __name__ == "__main__":
+    print(f"Packed {build_atlas()} icons.")
@@ -5,6 +5,7 @@ from bs4 import BeautifulSoup
 from io import BytesIO
 import json
 import logging
+import os
 import re
 import time
 import zipfile
@@ -16,18 +17,24 @@ async def main(num_of_workers):
 
     res = await get_translations(num_of_workers)
 
-    translations = {}
-    translations["by_code"] = {}
-    translations["by_name"] = {}
+    # translations folder (copy to mac_easy_manager/config):
+    # index.json = {"by_code": {code: language}}, read at start
+    # {code}.json = {container: translation}, read only when language is used
+    os.makedirs("translations",exist_ok=True)
+
+    index = {}
+    index["by_code"] = {}
 
     res.sort(key=lambda k: k[0]) # sort by language name
     for data in res:
         name, code, trans = data
-        translations["by_code"][code] = name
-        translations["by_name"][name] = {cont:translation for cont, translation in trans}
+        index["by_code"][code] = name
+
+        with open(os.path.join("translations",f"{code}.json"),"w",encoding="utf-8") as f:
+            json.dump({cont:translation for cont, translation in trans},f)
 
-    with open("container_translations.json","w",encoding="utf-8") as f:
-        json.dump(translations,f)
+    with open(os.path.join("translations","index.json"),"w",encoding="utf-8") as f:
+        json.dump(index,f)
 
     duration = time.perf_counter() - start
     logging.info(f"Completed in {duration} s.")